@@ -267,7 +267,7 @@ WORKFLOW_ENGINE_NAME = "workflow-engine"
 REANA_GITLAB_HOST = os.getenv("REANA_GITLAB_HOST", "CHANGE_ME")
 """GitLab API HOST"""
 
-REANA_GITLAB_URL = "https://{}".format(REANA_GITLAB_HOST)
+REANA_GITLAB_URL = f"https://{REANA_GITLAB_HOST}"
 """GitLab API URL"""
 
 REANA_HOSTNAME = os.getenv("REANA_HOSTNAME", "CHANGE_ME")
@@ -367,3 +367,18 @@ CONTAINER_IMAGE_ALIAS_PREFIXES = ["docker.io/", "docker.io/library/", "library/"
 
 MAX_WORKFLOW_SHARING_MESSAGE_LENGTH = 5000
 """Maximum length of the user-provided message when sharing a workflow."""
+
+MAX_WORKFLOW_SEARCH_LENGTH = 4096
+"""Maximum length of the JSON-encoded search filter when listing workflows."""
+
+WORKSPACE_CREATION_MAX_WORKERS = int(os.getenv("WORKSPACE_CREATION_MAX_WORKERS", 4))
+"""Maximum number of threads per process creating workflow workspaces."""
+
+WORKSPACE_DIFF_MAX_WORKERS = int(os.getenv("WORKSPACE_DIFF_MAX_WORKERS", 4))
+"""Maximum number of threads per process computing workspace differences."""
+
+WORKFLOWS_LISTING_CHUNK_SIZE = 200
+"""Number of workflows loaded from the database at once when listing workflows."""
+
+RESPONSE_COMPRESSION_MIN_SIZE = 4096
+"""Minimum size in bytes of the workflow logs responses compressed with gzip."""
@@ -12,7 +12,9 @@ from __future__ import absolute_import
 
 import logging
 
+import orjson
 from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
 from marshmallow.exceptions import ValidationError
 from reana_commons.config import REANA_LOG_FORMAT, REANA_LOG_LEVEL
 from reana_db.database import Session
@@ -22,6 +24,29 @@ from werkzeug.exceptions import UnprocessableEntity
 from reana_db.models import Base  # isort:skip  # noqa
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider using ``orjson``, which is much faster than ``json``.
+
+    Dates are still passed to ``default``, so that they are serialized as HTTP
+    dates like with the default provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as JSON to a string."""
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(
+            obj, default=kwargs.get("default", self.default), option=option
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data as JSON from a string or bytes."""
+        return orjson.loads(s)
+
+
 def handle_args_validation_error(error: UnprocessableEntity):
     """Error handler for werkzeug exception ``UnprocessableEntity``.
 
@@ -39,9 +64,7 @@ def handle_args_validation_error(error: UnprocessableEntity):
         # {"json": {"field name": ["error 1", "error 2"]}}
         for field_messages in exception.normalized_messages().values():
             for field, messages in field_messages.items():
-                validation_messages.append(
-                    "Field '{}': {}".format(field, ", ".join(messages))
-                )
+                validation_messages.append(f"Field '{field}': {', '.join(messages)}")
         error_message = ". ".join(validation_messages)
 
     return jsonify({"message": error_message}), 400
@@ -51,6 +74,7 @@ def create_app(config_mapping=None):
     """REANA Workflow Controller application factory."""
     logging.basicConfig(level=REANA_LOG_LEVEL, format=REANA_LOG_FORMAT)
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config.from_object("reana_workflow_controller.config")
     if config_mapping:
         app.config.from_mapping(config_mapping)
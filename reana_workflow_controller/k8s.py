@@ -286,14 +286,12 @@ def build_interactive_jupyter_deployment_k8s_objects(
     )
     command_args = [
         "start-notebook.sh",
-        "--NotebookApp.base_url='{base_url}'".format(base_url=access_path),
-        "--notebook-dir='{workflow_workspace}'".format(workflow_workspace=workspace),
+        f"--NotebookApp.base_url='{access_path}'",
+        f"--notebook-dir='{workspace}'",
         f'--NotebookApp.terminado_settings={{"shell_command": ["/usr/bin/bash", "-c", "cd \'{workspace}\' && bash"]}}',
     ]
     if access_token:
-        command_args.append(
-            "--NotebookApp.token='{access_token}'".format(access_token=access_token)
-        )
+        command_args.append(f"--NotebookApp.token='{access_token}'")
     deployment_builder.add_command_arguments(command_args)
     deployment_builder.add_reana_shared_storage()
     if cvmfs_repos:
@@ -346,7 +344,7 @@ def instantiate_chained_k8s_objects(kubernetes_objects, namespace):
                 k8s_object.metadata.owner_references = parent_k8s_object_references
                 result = instantiate_k8s_object[kind](namespace, k8s_object)
     except KeyError:
-        raise Exception("Unsupported Kubernetes object kind {}.".format(kind))
+        raise Exception(f"Unsupported Kubernetes object kind {kind}.")
     except ApiException as e:
         raise ApiException(
             "Exception when calling ExtensionsV1beta1Api->"
@@ -379,7 +377,7 @@ def delete_k8s_objects_if_exist(kubernetes_objects, namespace):
                 else:
                     raise
     except KeyError:
-        raise Exception("Unsupported Kubernetes object kind {}.".format(kind))
+        raise Exception(f"Unsupported Kubernetes object kind {kind}.")
 
 
 def delete_k8s_ingress_object(ingress_name, namespace):
@@ -394,10 +392,10 @@ def delete_k8s_ingress_object(ingress_name, namespace):
         )
     except ApiException as k8s_api_exception:
         if k8s_api_exception.reason == "Not Found":
-            raise Exception("K8s object was not found {}.".format(ingress_name))
+            raise Exception(f"K8s object was not found {ingress_name}.")
         raise Exception(
             "Exception when calling ExtensionsV1beta1->"
-            "Api->delete_namespaced_ingress: {}\n".format(k8s_api_exception)
+            f"Api->delete_namespaced_ingress: {k8s_api_exception}\n"
         )
 
 
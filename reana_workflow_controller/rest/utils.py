@@ -8,13 +8,17 @@
 
 """REANA Workflow Controller workflows REST API."""
 
+import base64
+import binascii
 import difflib
 import fs
+import gzip
 import json
 import logging
 import mimetypes
 import os
 import pprint
+import re
 import subprocess
 import traceback
 import time
@@ -25,10 +29,10 @@ from datetime import datetime
 from functools import wraps
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from flask import jsonify, request, send_file
+from flask import Response, g, jsonify, request, send_file
 from git import Repo
 from kubernetes.client.rest import ApiException
 from reana_commons import workspace
@@ -50,6 +54,7 @@ from reana_db.models import (
     WorkflowResource,
 )
 from reana_db.utils import (
+    _get_workflow_with_uuid_or_name,
     store_workflow_disk_quota,
     update_users_disk_quota,
     get_default_quota_resource,
@@ -63,6 +68,7 @@ from reana_workflow_controller.config import (
     PROGRESS_STATUSES,
     REANA_GITLAB_HOST,
     PREVIEWABLE_MIME_TYPE_PREFIXES,
+    RESPONSE_COMPRESSION_MIN_SIZE,
 )
 from reana_workflow_controller.consumer import _update_workflow_status
 from reana_workflow_controller.errors import (
@@ -88,12 +94,10 @@ def start_workflow(workflow, parameters):
     current_db_sessions = Session.object_session(workflow)
     kwrm = KubernetesWorkflowRunManager(workflow)
 
+    verb = get_workflow_status_change_verb(workflow.status.name)
     failure_message = (
-        "Workflow {id_} could not be started because it {verb} " "already {status}."
-    ).format(
-        id_=workflow.id_,
-        verb=get_workflow_status_change_verb(workflow.status.name),
-        status=str(workflow.status.name),
+        f"Workflow {workflow.id_} could not be started because it {verb} "
+        f"already {workflow.status.name}."
     )
     if "restart" in parameters.keys():
         if parameters["restart"]:
@@ -140,7 +144,7 @@ def stop_workflow(workflow):
         _update_workflow_status(workflow, RunStatus.stopped, logs="")
         Session.commit()
     else:
-        message = ("Workflow {id_} is not running.").format(id_=workflow.id_)
+        message = f"Workflow {workflow.id_} is not running."
         raise REANAWorkflowControllerError(message)
 
 
@@ -150,18 +154,16 @@ def get_workflow_name(workflow):
     :param workflow: Workflow object which name should be returned.
     :type workflow: reana-commons.models.Workflow
     """
-    return workflow.name + "." + str(workflow.run_number)
+    return f"{workflow.name}.{workflow.run_number}"
+
+
+_UUID_V4_HEX_REGEX = re.compile(r"[0-9a-f]{12}4[0-9a-f]{3}[89ab][0-9a-f]{15}")
+"""Lowercase hexadecimal representation of a UUIDv4, without dashes."""
 
 
 def is_uuid_v4(uuid_or_name: str) -> bool:
     """Check if given string is a valid UUIDv4."""
-    # Based on https://gist.github.com/ShawnMilo/7777304
-    try:
-        uuid = UUID(uuid_or_name, version=4)
-    except Exception:
-        return False
-
-    return uuid.hex == uuid_or_name.replace("-", "")
+    return _UUID_V4_HEX_REGEX.fullmatch(uuid_or_name.replace("-", "")) is not None
 
 
 def build_workflow_logs(workflow, steps=None, paginate=None):
@@ -207,6 +209,29 @@ def build_workflow_logs(workflow, steps=None, paginate=None):
     return all_logs
 
 
+TRUNCATED_LOGS_PLACEHOLDER = "<truncated>"
+
+
+def truncate_workflow_logs(value, depth):
+    """Replace the containers nested deeper than ``depth`` by a placeholder.
+
+    :param value: Workflow logs, as returned by ``build_workflow_logs``, or
+        any other nested structure of dictionaries and lists.
+    :param depth: Number of nesting levels to keep. With ``depth=1``, only the
+        top-level keys of ``value`` are kept and their dictionary or list
+        values are replaced by ``TRUNCATED_LOGS_PLACEHOLDER``.
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+    if depth <= 0:
+        return TRUNCATED_LOGS_PLACEHOLDER
+    if isinstance(value, dict):
+        return {
+            key: truncate_workflow_logs(item, depth - 1) for key, item in value.items()
+        }
+    return [truncate_workflow_logs(item, depth - 1) for item in value]
+
+
 def remove_workflow_jobs_from_cache(workflow):
     """Remove any cached jobs from given workflow.
 
@@ -244,6 +269,8 @@ def delete_workflow(workflow, all_runs=False, workspace=False):
                     )
                     .all()
                 )
+            if workspace:
+                disk_resource = get_default_quota_resource(ResourceType.disk.name)
             for workflow in to_be_deleted:
                 # 1. Stop open interactive sessions
                 int_session = workflow.sessions.first()
@@ -255,7 +282,6 @@ def delete_workflow(workflow, all_runs=False, workspace=False):
                     # 2. delete the workspace
                     remove_workflow_workspace(workflow.workspace_path)
                     # 3. update the disk usage of the user
-                    disk_resource = get_default_quota_resource(ResourceType.disk.name)
                     workflow_disk_resource = WorkflowResource.query.filter(
                         WorkflowResource.workflow_id == workflow.id_,
                         WorkflowResource.resource_id == disk_resource.id_,
@@ -287,9 +313,7 @@ def delete_workflow(workflow, all_runs=False, workspace=False):
                 remove_workflow_jobs_from_cache(workflow)
 
             if all_runs:
-                message = "All workflows named {0} successfully deleted.".format(
-                    workflow.name
-                )
+                message = f"All workflows named {workflow.name} successfully deleted."
             else:
                 message = "Workflow successfully deleted."
             return (
@@ -309,8 +333,8 @@ def delete_workflow(workflow, all_runs=False, workspace=False):
             return jsonify({"message": str(e)}), 500
     elif workflow.status == RunStatus.running:
         raise REANAWorkflowDeletionError(
-            "Workflow {0}.{1} cannot be deleted as it"
-            " is currently running.".format(workflow.name, workflow.run_number)
+            f"Workflow {workflow.name}.{workflow.run_number} cannot be deleted as it"
+            " is currently running."
         )
 
 
@@ -356,6 +380,10 @@ def get_specification_diff(workflow_a, workflow_b, output_format="unified"):
     elif output_format == "html":
         diff_method = getattr(difflib, "HtmlDiff")
 
+    if workflow_a.id_ == workflow_b.id_:
+        # a workflow specification never differs from itself
+        return {section: [] for section in workflow_a.reana_specification}
+
     specification_diff = dict.fromkeys(workflow_a.reana_specification.keys())
     for section in specification_diff:
         if section == "inputs":
@@ -390,9 +418,7 @@ def create_workflow_workspace(
         if not gitlab_access_token_secret:
             raise Exception("GitLab access token not found.")
         gitlab_access_token = gitlab_access_token_secret.value_str
-        url = "https://oauth2:{0}@{1}/{2}.git".format(
-            gitlab_access_token, REANA_GITLAB_HOST, git_url
-        )
+        url = f"https://oauth2:{gitlab_access_token}@{REANA_GITLAB_HOST}/{git_url}.git"
         repo = Repo.clone_from(
             url=url,
             to_path=os.path.abspath(path),
@@ -427,7 +453,7 @@ def mv_files(source, target, workflow):
     try:
         workspace.move(workflow.workspace_path, source, target)
     except Exception as e:
-        message = "Something went wrong:\n {}".format(e)
+        message = f"Something went wrong:\n {e}"
         raise REANAWorkflowControllerError(message)
 
 
@@ -560,11 +586,8 @@ def download_files_recursive_wildcard(workflow_name, workspace_path, path_or_pat
     def _send_zipped_dir_or_files(workflow_name, dir_path=None, file_paths=None):
         """Wrap directory into a zip file in memory and send it to the client."""
         timestr = time.strftime("%Y-%m-%d-%H%M%S")
-        filename = "download_{}_{}_{}.zip".format(
-            workflow_name,
-            os.path.basename(remove_upper_level_references(path_or_pattern)),
-            timestr,
-        )
+        pattern_name = os.path.basename(remove_upper_level_references(path_or_pattern))
+        filename = f"download_{workflow_name}_{pattern_name}_{timestr}.zip"
         memory_file = BytesIO()
         with zipfile.ZipFile(memory_file, "w", zipfile.ZIP_DEFLATED) as zipf:
             if dir_path:
@@ -657,12 +680,39 @@ def get_workspace_diff(workflow_a, workflow_b, brief=False, context_lines=5):
     :rtype: Dictionary with file paths and their sizes
             unique to each workspace.
     """
-    workspace_a = workflow_a.workspace_path
-    workspace_b = workflow_b.workspace_path
+    return diff_workspaces(
+        workflow_a.workspace_path,
+        get_workflow_name(workflow_a),
+        workflow_b.workspace_path,
+        get_workflow_name(workflow_b),
+        brief,
+        context_lines,
+    )
+
+
+def diff_workspaces(
+    workspace_a, workflow_name_a, workspace_b, workflow_name_b, brief, context_lines
+):
+    """Return differences between two workspaces, given by their paths.
+
+    Unlike ``get_workspace_diff``, it does not access the workflows, so it can
+    run outside of the thread owning their database session.
+
+    :param workspace_a: Path of the first workspace to be compared.
+    :param workflow_name_a: Name of the workflow owning the first workspace.
+    :param workspace_b: Path of the second workspace to be compared.
+    :param workflow_name_b: Name of the workflow owning the second workspace.
+    :param brief: Flag to show brief workspace diff.
+    :param context_lines: The number of context lines to show above and after
+                          the discovered differences.
+    """
+    if workspace_a == workspace_b and os.path.exists(workspace_a):
+        # no need to walk the workspace when comparing it with itself
+        return ""
     if os.path.exists(workspace_a) and os.path.exists(workspace_b):
         diff_command = [
             "diff",
-            "--unified={}".format(context_lines),
+            f"--unified={context_lines}",
             "-r",
             workspace_a,
             workspace_b,
@@ -671,51 +721,50 @@ def get_workspace_diff(workflow_a, workflow_b, brief=False, context_lines=5):
             diff_command.append("-q")
         diff_result = subprocess.run(diff_command, stdout=subprocess.PIPE)
         diff_result_string = diff_result.stdout.decode("utf-8")
-        diff_result_string = diff_result_string.replace(
-            workspace_a,
-            get_workflow_name(workflow_a),
-        )
-        diff_result_string = diff_result_string.replace(
-            workspace_b,
-            get_workflow_name(workflow_b),
-        )
+        diff_result_string = diff_result_string.replace(workspace_a, workflow_name_a)
+        diff_result_string = diff_result_string.replace(workspace_b, workflow_name_b)
 
         return diff_result_string
     else:
         if not os.path.exists(workspace_a):
-            raise ValueError(
-                "Workspace of {} does not exist.".format(get_workflow_name(workflow_a))
-            )
+            raise ValueError(f"Workspace of {workflow_name_a} does not exist.")
         if not os.path.exists(workspace_b):
-            raise ValueError(
-                "Workspace of {} does not exist.".format(get_workflow_name(workflow_b))
-            )
+            raise ValueError(f"Workspace of {workflow_name_b} does not exist.")
+
+
+def get_most_recent_jobs_info(workflow_ids: List[UUID]) -> Dict[UUID, Dict[str, str]]:
+    """Return most recent Job cmd and name of each of the given workflows."""
+    most_recent_jobs = (
+        Session.query(Job.workflow_uuid, Job.prettified_cmd, Job.job_name)
+        .filter(Job.workflow_uuid.in_(workflow_ids))
+        .order_by(Job.workflow_uuid, Job.created.desc())
+        .distinct(Job.workflow_uuid)
+    )
+    return {
+        workflow_id: {"prettified_cmd": prettified_cmd, "current_job_name": job_name}
+        for workflow_id, prettified_cmd, job_name in most_recent_jobs
+    }
 
 
 def get_most_recent_job_info(workflow_id: UUID) -> Dict[str, str]:
     """Return most recent Job cmd and name from a certain workflow."""
-    current_job_commands = {}
-    most_recent_job = (
-        Session.query(Job)
-        .filter_by(workflow_uuid=workflow_id)
-        .order_by(Job.created.desc())
-        .first()
-    )
-    if most_recent_job:
-        current_job_commands = {
-            "prettified_cmd": most_recent_job.prettified_cmd,
-            "current_job_name": most_recent_job.job_name,
-        }
-    return current_job_commands
+    return get_most_recent_jobs_info([workflow_id]).get(workflow_id, {})
 
 
-def get_workflow_progress(workflow: Workflow, include_progress: bool = False) -> Dict:
+def get_workflow_progress(
+    workflow: Workflow,
+    include_progress: bool = False,
+    most_recent_job_info: Optional[Dict[str, str]] = None,
+) -> Dict:
     """Return workflow progress information.
 
     :param workflow: The workflow to get progress information from.
     :type: reana_db.models.Workflow instance.
     :param include_progress: Whether or not to include the job progress information.
     :type: bool.
+    :param most_recent_job_info: Most recent job information of the workflow, if
+        already known. It is looked up otherwise.
+    :type: dict.
 
     :return: Dictionary with workflow progress information.
     """
@@ -743,21 +792,99 @@ def get_workflow_progress(workflow: Workflow, include_progress: bool = False) ->
     if include_progress:
         initial_progress_status = {"total": 0, "job_ids": []}
         for status, _ in PROGRESS_STATUSES:
-            progress[status] = (
+            status_progress = (
                 workflow.job_progress.get(status) or initial_progress_status
             )
-            # remove invalid job IDs like `None` from the list
-            progress[status]["job_ids"] = [
-                job_id for job_id in progress[status]["job_ids"] if job_id
-            ]
+            # copy, so that neither the workflow's `job_progress` nor the
+            # shared initial status are modified when filtering the job IDs,
+            # and remove invalid job IDs like `None` from the list
+            progress[status] = dict(
+                status_progress,
+                job_ids=[job_id for job_id in status_progress["job_ids"] if job_id],
+            )
 
-        most_recent_job_info = get_most_recent_job_info(workflow.id_)
+        if most_recent_job_info is None:
+            most_recent_job_info = get_most_recent_job_info(workflow.id_)
         progress["current_command"] = most_recent_job_info.get("prettified_cmd")
         progress["current_step_name"] = most_recent_job_info.get("current_job_name")
 
     return progress
 
 
+def gzip_response(response: Response) -> Response:
+    """Compress the response body with gzip if the client accepts it.
+
+    Responses smaller than ``RESPONSE_COMPRESSION_MIN_SIZE`` are left as they
+    are, as compressing them is not worth the CPU time.
+
+    :param response: Response to compress, with a body that is not streamed.
+    """
+    response.vary.add("Accept-Encoding")
+    if (
+        not request.accept_encodings["gzip"]
+        or response.content_length < RESPONSE_COMPRESSION_MIN_SIZE
+    ):
+        return response
+    response.set_data(gzip.compress(response.get_data(), compresslevel=5))
+    response.content_encoding = "gzip"
+    return response
+
+
+def format_workflow_time(value: datetime) -> str:
+    """Format a workflow date as ``WORKFLOW_TIME_FORMAT``.
+
+    ``WORKFLOW_TIME_FORMAT`` is ISO 8601 with seconds precision, so the
+    faster ``isoformat`` is used instead of ``strftime``.
+
+    :param value: Naive datetime to format.
+    :return: Formatted date.
+    """
+    return value.isoformat(timespec="seconds")
+
+
+def get_workflow_with_uuid_or_name_cached(
+    uuid_or_name: str, user_uuid: str, include_shared_workflows: bool = False
+) -> Workflow:
+    """Get workflow by UUID or name, reusing lookups done in the same request.
+
+    :param uuid_or_name: UUID or name of the workflow.
+    :param user_uuid: UUID of the user requesting the workflow.
+    :param include_shared_workflows: Whether to also look for shared workflows.
+    :return: The resolved workflow.
+    """
+    cache = g.setdefault("workflows_by_uuid_or_name", {})
+    key = (uuid_or_name, str(user_uuid), include_shared_workflows)
+    if key not in cache:
+        cache[key] = _get_workflow_with_uuid_or_name(*key)
+    return cache[key]
+
+
+def encode_workflow_cursor(workflow: Workflow) -> str:
+    """Build an opaque keyset pagination cursor pointing at the given workflow.
+
+    :param workflow: Last workflow of the current page.
+    :return: URL-safe cursor string.
+    """
+    cursor = f"{workflow.created.isoformat()},{workflow.id_}"
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def decode_workflow_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a keyset pagination cursor built by ``encode_workflow_cursor``.
+
+    :param cursor: Cursor string received from the client.
+    :return: Tuple with creation date and UUID of the workflow.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        created, id_ = base64.urlsafe_b64decode(cursor.encode()).decode().split(",")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid pagination cursor {cursor}.") from e
+    if not is_uuid_v4(id_):
+        raise ValueError(f"Invalid pagination cursor {cursor}.")
+    return datetime.fromisoformat(created), id_
+
+
 def use_paginate_args():
     """Get and validate pagination arguments.
 
@@ -797,21 +924,24 @@ def use_paginate_args():
                     )
                 )
 
-            def paginate(query_or_list):
+            def paginate(query_or_list, total=None):
                 """Paginate based on received page and size args.
 
                 :param query_or_list: Query or list to paginate.
                 :type: sqlalchemy.orm.query.Query | list.
+                :param total: Total number of items, if already known.
+                :type: int
 
                 :return: Dictionary with paginated items and some useful information.
                 """
                 items = query_or_list
                 has_prev, has_next = False, False
-                total = (
-                    len(query_or_list)
-                    if isinstance(query_or_list, list)
-                    else query_or_list.count()
-                )
+                if total is None:
+                    total = (
+                        len(query_or_list)
+                        if isinstance(query_or_list, list)
+                        else query_or_list.count()
+                    )
 
                 if req.get("size"):
                     if isinstance(query_or_list, list):
@@ -9,30 +9,62 @@
 """REANA Workflow Controller workflows REST API."""
 
 import datetime
+import hashlib
 import json
 import logging
 import re
-from typing import Optional
-from uuid import uuid4
-
-from flask import Blueprint, jsonify, request
-from sqlalchemy import and_, nullslast, or_, select
-from sqlalchemy.orm import aliased
-from sqlalchemy.exc import IntegrityError
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import orjson
+from flask import Blueprint, Response, g, jsonify, request
+from marshmallow import ValidationError
+from sqlalchemy import (
+    and_,
+    exists,
+    func,
+    literal_column,
+    nullslast,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.orm import aliased, load_only
 from webargs import fields, validate
 from webargs.flaskparser import use_args, use_kwargs
-from reana_commons.config import WORKFLOW_TIME_FORMAT
+from reana_db.config import DEFAULT_QUOTA_RESOURCES
 from reana_db.database import Session
-from reana_db.models import RunStatus, User, UserWorkflow, Workflow, WorkflowResource
+from reana_db.models import (
+    InteractiveSession,
+    Job,
+    Resource,
+    ResourceType,
+    ResourceUnit,
+    RunStatus,
+    User,
+    UserWorkflow,
+    Workflow,
+    WorkflowResource,
+    WorkflowSession,
+    WorkspaceRetentionRule,
+)
 from reana_db.utils import (
     _get_workflow_by_uuid,
     _get_workflow_with_uuid_or_name,
     build_workspace_path,
-    get_default_quota_resource,
 )
 from reana_workflow_controller.config import (
     DEFAULT_NAME_FOR_WORKFLOWS,
+    MAX_WORKFLOW_SEARCH_LENGTH,
     MAX_WORKFLOW_SHARING_MESSAGE_LENGTH,
+    WORKFLOWS_LISTING_CHUNK_SIZE,
+    WORKSPACE_CREATION_MAX_WORKERS,
+    WORKSPACE_DIFF_MAX_WORKERS,
 )
 from reana_workflow_controller.errors import (
     REANAWorkflowControllerError,
@@ -40,11 +72,17 @@ from reana_workflow_controller.errors import (
 )
 from reana_workflow_controller.rest.utils import (
     create_workflow_workspace,
+    decode_workflow_cursor,
+    diff_workspaces,
+    encode_workflow_cursor,
+    format_workflow_time,
+    get_most_recent_jobs_info,
     get_specification_diff,
     get_workflow_name,
     get_workflow_progress,
-    get_workspace_diff,
+    get_workflow_with_uuid_or_name_cached,
     is_uuid_v4,
+    remove_workflow_workspace,
     use_paginate_args,
 )
 
@@ -55,6 +93,194 @@ STATUSES = {START, STOP, DELETED}
 
 blueprint = Blueprint("workflows", __name__)
 
+_workspace_creation_executor = ThreadPoolExecutor(
+    max_workers=WORKSPACE_CREATION_MAX_WORKERS,
+    thread_name_prefix="workspace-creation",
+)
+
+_workspace_diff_executor = ThreadPoolExecutor(
+    max_workers=WORKSPACE_DIFF_MAX_WORKERS,
+    thread_name_prefix="workspace-diff",
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_search(search: str) -> str:
+    """Parse the JSON-encoded search filter, caching recently seen filters."""
+    if len(search) > MAX_WORKFLOW_SEARCH_LENGTH:
+        raise ValidationError("Search filter is too long.")
+    try:
+        search = json.loads(search)
+    except json.JSONDecodeError:
+        raise ValidationError("Search filter is not valid JSON.")
+    if not isinstance(search, dict):
+        raise ValidationError("Search filter must be a JSON object.")
+    names = search.get("name", [""])
+    if not (isinstance(names, list) and names and isinstance(names[0], str)):
+        raise ValidationError("Searched name must be a non-empty list of strings.")
+    return names[0]
+
+
+class _SearchField(fields.Field):
+    """Search filter such as ``{"name": ["foo"]}``, deserialized to the name."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, str):
+            raise ValidationError("Search filter must be a string.")
+        return _parse_search(value) if value else ""
+
+
+def _get_user_id_and_email(user_uuid: str):
+    """Get the id and email of a user, reusing lookups done in the same request."""
+    cache = g.setdefault("users_by_uuid", {})
+    if user_uuid not in cache:
+        cache[user_uuid] = (
+            Session.query(User.id_, User.email).filter(User.id_ == user_uuid).first()
+        )
+    return cache[user_uuid]
+
+
+def _get_owner_emails(
+    user: User, workflows: List[Workflow], shared_by: Optional[str] = None
+) -> Dict:
+    """Get the email of the owners of the given workflows, keyed by owner id.
+
+    :param user: User listing the workflows.
+    :param workflows: Listed workflows.
+    :param shared_by: Email of the owner of all the given workflows, if known.
+    """
+    owner_ids = {workflow.owner_id for workflow in workflows}
+    if owner_ids <= {user.id_}:
+        # only owned workflows are listed, no need to look up other owners
+        return {user.id_: user.email}
+    if shared_by:
+        return {owner_id: shared_by for owner_id in owner_ids}
+    return dict(
+        Session.query(User.id_, User.email).filter(User.id_.in_(owner_ids)).all()
+    )
+
+
+def _get_shared_with_emails(workflow_ids: List) -> Dict[str, List[str]]:
+    """Get the emails of the users each of the given workflows is shared with."""
+    shared_with_emails = defaultdict(list)
+    if workflow_ids:
+        for workflow_id, email in (
+            Session.query(UserWorkflow.workflow_id, User.email)
+            .join(User, User.id_ == UserWorkflow.user_id)
+            .filter(UserWorkflow.workflow_id.in_(workflow_ids))
+        ):
+            shared_with_emails[workflow_id].append(email)
+    return shared_with_emails
+
+
+def _get_interactive_sessions(workflow_ids: List) -> Dict:
+    """Get the interactive session of each of the given workflows, if any."""
+    interactive_sessions = {}
+    for workflow_id, int_session in (
+        Session.query(WorkflowSession.workflow_id, InteractiveSession)
+        .join(InteractiveSession, InteractiveSession.id_ == WorkflowSession.session_id)
+        .filter(WorkflowSession.workflow_id.in_(workflow_ids))
+    ):
+        interactive_sessions.setdefault(workflow_id, int_session)
+    return interactive_sessions
+
+
+def _get_workspace_disk_usage(workflow_ids: List) -> Dict:
+    """Get the disk usage of the workspace of each of the given workflows.
+
+    The format is the same as the disk usage returned by
+    ``Workflow.get_quota_usage()``.
+    """
+    disk_usage_raw = defaultdict(int)
+    disk_units = {}
+    for workflow_id, unit, quota_used in (
+        Session.query(
+            WorkflowResource.workflow_id, Resource.unit, WorkflowResource.quota_used
+        )
+        .join(Resource, Resource.id_ == WorkflowResource.resource_id)
+        .filter(
+            Resource.type_ == ResourceType.disk,
+            WorkflowResource.workflow_id.in_(workflow_ids),
+        )
+    ):
+        disk_usage_raw[workflow_id] += quota_used
+        disk_units[workflow_id] = unit
+    return {
+        workflow_id: {
+            "raw": raw,
+            "human_readable": ResourceUnit.human_readable_unit(
+                disk_units[workflow_id], raw
+            ),
+        }
+        for workflow_id, raw in disk_usage_raw.items()
+    }
+
+
+def _has_workflows(query, criterion) -> bool:
+    """Check whether the listing query has workflows matching the criterion."""
+    return Session.query(query.filter(criterion).order_by(None).exists()).scalar()
+
+
+def _get_workflows_etag(
+    page_workflow_ids: List[UUID], include_progress: bool, *validators
+) -> str:
+    """Return the ETag of a workflow listing page, without building the page.
+
+    Besides the given validators, the ETag changes whenever the shares,
+    interactive sessions or resources of the listed workflows, or their most
+    recent jobs if the progress is listed, are added, removed or updated. Shares
+    have no timestamps, so they are tracked by their workflow and user IDs
+    instead. Only the workflows of the page are looked at, so that the cost does
+    not grow with the number of workflows of the user.
+
+    :param page_workflow_ids: IDs of the workflows listed in the page.
+    :param include_progress: Whether the progress of the workflows is listed.
+    :param validators: Other values the listing depends on.
+    """
+    changes = ()
+    if page_workflow_ids:
+
+        def _count_and_last_update(updated, criterion):
+            return [
+                select(func.count()).where(criterion).scalar_subquery(),
+                select(func.max(updated)).where(criterion).scalar_subquery(),
+            ]
+
+        share = func.concat(UserWorkflow.workflow_id, UserWorkflow.user_id)
+        columns = [
+            select(
+                func.md5(
+                    func.string_agg(
+                        share, aggregate_order_by(literal_column("','"), share)
+                    )
+                )
+            )
+            .where(UserWorkflow.workflow_id.in_(page_workflow_ids))
+            .scalar_subquery(),
+            *_count_and_last_update(
+                InteractiveSession.updated,
+                InteractiveSession.id_.in_(
+                    select(WorkflowSession.session_id).where(
+                        WorkflowSession.workflow_id.in_(page_workflow_ids)
+                    )
+                ),
+            ),
+            *_count_and_last_update(
+                WorkflowResource.updated,
+                WorkflowResource.workflow_id.in_(page_workflow_ids),
+            ),
+        ]
+        if include_progress:
+            # the listed job details are set when jobs are created, so the
+            # ``(workflow_uuid, created)`` index is enough to track them
+            columns.extend(
+                _count_and_last_update(
+                    Job.created, Job.workflow_uuid.in_(page_workflow_ids)
+                )
+            )
+        changes = tuple(Session.query(*columns).one())
+    return hashlib.sha1(repr((validators, changes)).encode()).hexdigest()
+
 
 @blueprint.route("/workflows", methods=["GET"])
 @use_paginate_args()
@@ -62,7 +288,7 @@ blueprint = Blueprint("workflows", __name__)
     {
         "include_progress": fields.Bool(),
         "include_workspace_size": fields.Bool(),
-        "search": fields.String(missing=""),
+        "search": _SearchField(missing=""),
         "sort": fields.String(missing="desc"),
         "status": fields.String(missing=""),
         "type": fields.String(required=True),
@@ -72,6 +298,8 @@ blueprint = Blueprint("workflows", __name__)
         "shared": fields.Bool(missing=False),
         "shared_by": fields.String(),
         "shared_with": fields.String(),
+        "after": fields.String(),
+        "before": fields.String(),
     },
     location="query",
 )
@@ -106,7 +334,10 @@ def get_workflows(args, paginate=None):  # noqa
           type: boolean
         - name: search
           in: query
-          description: Filter workflows by name.
+          description: >-
+            Filter workflows by name. The given text is matched
+            case-insensitively anywhere in the workflow name. The characters
+            "%" and "_" are matched literally, not as wildcards.
           required: false
           type: string
         - name: sort
@@ -131,6 +362,22 @@ def get_workflows(args, paginate=None):  # noqa
           description: Number of results per page (pagination).
           required: false
           type: integer
+        - name: after
+          in: query
+          description: >-
+            Cursor of the last workflow of the previous page, as returned in
+            `next_cursor`. Can be used instead of `page` when sorting by
+            creation date (cursor-based pagination).
+          required: false
+          type: string
+        - name: before
+          in: query
+          description: >-
+            Cursor of the first workflow of the next page, as returned in
+            `prev_cursor`. Can be used instead of `page` when sorting by
+            creation date (cursor-based pagination).
+          required: false
+          type: string
         - name: include_progress
           in: query
           description: Include progress information of the workflows.
@@ -171,6 +418,12 @@ def get_workflows(args, paginate=None):  # noqa
             properties:
               total:
                 type: integer
+              next_cursor:
+                type: string
+                x-nullable: true
+              prev_cursor:
+                type: string
+                x-nullable: true
               items:
                 type: array
                 items:
@@ -256,6 +509,10 @@ def get_workflows(args, paginate=None):  # noqa
                   "launcher_url": null,
                 }
               ]
+        304:
+          description: >-
+            Request succeeded. The listing matches the ETag sent in the
+            `If-None-Match` header, so it is not sent again.
         400:
           description: >-
             Request failed. The incoming data specification seems malformed.
@@ -282,7 +539,7 @@ def get_workflows(args, paginate=None):  # noqa
     type_: str = args["type"]
     verbose: bool = args["verbose"]
     sort: str = args["sort"]
-    search: str = args["search"]
+    search_name: str = args["search"]
     status_list: str = args["status"]
     include_progress: bool = args.get("include_progress", verbose)
     include_workspace_size: bool = args.get("include_workspace_size", verbose)
@@ -290,52 +547,83 @@ def get_workflows(args, paginate=None):  # noqa
     shared: bool = args.get("shared")
     shared_by: Optional[str] = args.get("shared_by")
     shared_with: Optional[str] = args.get("shared_with")
+    after: Optional[str] = args.get("after")
+    before: Optional[str] = args.get("before")
 
     if shared_by and shared_with:
         message = "You cannot filter by shared_by and shared_with at the same time."
         return (jsonify({"message": message}), 400)
+    if after and before:
+        message = "You cannot paginate by after and before at the same time."
+        return (jsonify({"message": message}), 400)
+    if (after or before) and sort not in ["asc", "desc"]:
+        message = "Cursor pagination is only available when sorting by creation date."
+        return (jsonify({"message": message}), 400)
+    if (after or before) and "page" in request.args:
+        message = "You cannot paginate by page and cursor at the same time."
+        return (jsonify({"message": message}), 400)
 
     try:
 
-        user = User.query.filter(User.id_ == user_uuid).first()
+        user = _get_user_id_and_email(user_uuid)
         if not user:
-            return jsonify({"message": "User {} does not exist".format(user_uuid)}), 404
+            return jsonify({"message": f"User {user_uuid} does not exist"}), 404
+
+        owned_workflows = Session.query(Workflow).filter(Workflow.owner_id == user.id_)
+        workflows_shared_with_user = (
+            Session.query(Workflow)
+            .join(UserWorkflow, UserWorkflow.workflow_id == Workflow.id_)
+            .filter(UserWorkflow.user_id == user.id_)
+        )
 
         # default case: retrieve owned workflows
-        query = user.workflows
+        query = owned_workflows
         if shared_with:
             if shared_with == "nobody":
                 # retrieve owned unshared workflows
-                query = user.workflows.filter(
-                    Workflow.id_.notin_(select(UserWorkflow.workflow_id))
+                query = owned_workflows.filter(
+                    ~exists().where(UserWorkflow.workflow_id == Workflow.id_)
                 )
             elif shared_with == "anybody":
                 # retrieve exclusively owned shared workflows
-                query = user.workflows.filter(
-                    Workflow.id_.in_(select(UserWorkflow.workflow_id))
+                query = owned_workflows.filter(
+                    exists().where(UserWorkflow.workflow_id == Workflow.id_)
                 )
             else:
                 # retrieve owned workflows shared with specific user
-                query = user.workflows.filter(
-                    Workflow.users_it_is_shared_with.any(User.email == shared_with)
+                query = (
+                    owned_workflows.join(
+                        UserWorkflow, UserWorkflow.workflow_id == Workflow.id_
+                    )
+                    .join(User, User.id_ == UserWorkflow.user_id)
+                    .filter(User.email == shared_with)
                 )
         elif shared_by:
             if shared_by == "anybody":
                 # retrieve unowned workflows shared by anyone
-                query = user.workflows_shared_with_me
+                query = workflows_shared_with_user
             else:
                 # retrieve unowned workflows shared by specific user
-                query = user.workflows_shared_with_me.filter(
+                query = workflows_shared_with_user.filter(
                     Workflow.owner.has(User.email == shared_by)
                 )
         elif shared:
             # retrieve all workflows, owned and shared with user
-            query = user.workflows.union_all(user.workflows_shared_with_me)
+            query = Session.query(Workflow).filter(
+                or_(
+                    Workflow.owner_id == user.id_,
+                    Workflow.id_.in_(
+                        select(UserWorkflow.workflow_id).where(
+                            UserWorkflow.user_id == user.id_
+                        )
+                    ),
+                )
+            )
 
-        if search:
-            search = json.loads(search)
-            search_val = search.get("name")[0]
-            query = query.filter(Workflow.name.ilike("%{}%".format(search_val)))
+        if search_name:
+            # match wildcard characters in the searched name literally
+            search_val = re.sub(r"([\\%_])", r"\\\1", search_name)
+            query = query.filter(Workflow.name.ilike(f"%{search_val}%", escape="\\"))
         if status_list:
             workflow_status = [RunStatus[status] for status in status_list.split(",")]
             query = query.filter(Workflow.status.in_(workflow_status))
@@ -348,80 +636,244 @@ def get_workflows(args, paginate=None):  # noqa
         column_sorted = Workflow.created.desc()
         if sort in ["disk-desc", "cpu-desc"]:
             resource_type = sort.split("-")[0]
-            resource = get_default_quota_resource(resource_type)
+            # resolve the default resource within the listing query itself
+            default_resource_id = (
+                select(Resource.id_)
+                .where(Resource.name == DEFAULT_QUOTA_RESOURCES[resource_type])
+                .scalar_subquery()
+            )
             query = query.join(
                 WorkflowResource,
                 and_(
                     Workflow.id_ == WorkflowResource.workflow_id,
-                    WorkflowResource.resource_id == resource.id_,
+                    WorkflowResource.resource_id == default_resource_id,
                 ),
                 isouter=True,
             )
             column_sorted = nullslast(WorkflowResource.quota_used.desc())
         elif sort in ["asc", "desc"]:
             column_sorted = getattr(Workflow.created, sort)()
-        pagination_dict = paginate(query.order_by(column_sorted))
 
-        owner_ids = {workflow.owner_id for workflow in pagination_dict["items"]}
-        owners = dict(
-            Session.query(User.id_, User.email).filter(User.id_.in_(owner_ids)).all()
+        # count before ordering, as ``Query.count`` would wrap the whole ordered
+        # query in a ``SELECT count(*) FROM (...)`` subquery
+        total, last_update = query.with_entities(
+            func.count(Workflow.id_), func.max(Workflow.updated)
+        ).one()
+        user_has_workflows = Session.query(
+            exists().where(Workflow.owner_id == user.id_)
+        ).scalar()
+
+        # skip wide columns such as specification and logs, which are not listed
+        listed_columns = [
+            Workflow.id_,
+            Workflow.name,
+            Workflow.status,
+            Workflow.owner_id,
+            Workflow.launcher_url,
+            Workflow.created,
+            Workflow.run_number_major,
+            Workflow.run_number_minor,
+            Workflow.run_started_at,
+            Workflow.run_finished_at,
+            Workflow.run_stopped_at,
+        ]
+        if include_progress:
+            listed_columns.append(Workflow.job_progress)
+        query = query.options(load_only(*listed_columns))
+
+        if sort in ["asc", "desc"]:
+            # workflow UUIDs break ties so that cursors identify a unique position
+            query = query.order_by(column_sorted, getattr(Workflow.id_, sort)())
+        else:
+            query = query.order_by(column_sorted)
+
+        workflow_key = tuple_(Workflow.created, Workflow.id_)
+        size = request.args.get("size", type=int)
+        if after:
+            # keyset pagination: seek past the cursor instead of using OFFSET,
+            # fetching one extra workflow to know whether there is a next page
+            after_key = tuple_(*decode_workflow_cursor(after))
+            next_workflow_ids = [
+                workflow_id
+                for (workflow_id,) in query.filter(
+                    workflow_key < after_key
+                    if sort == "desc"
+                    else workflow_key > after_key
+                )
+                .with_entities(Workflow.id_)
+                .limit(size + 1 if size else None)
+            ]
+            pagination_dict = paginate(
+                query.filter(Workflow.id_.in_(next_workflow_ids[:size])),
+                total=total,
+            )
+            pagination_dict.update(
+                # the cursor may point at or past the last workflow, for
+                # example after a deletion, in which case the page is empty
+                has_prev=bool(next_workflow_ids)
+                and _has_workflows(
+                    query,
+                    (
+                        workflow_key >= after_key
+                        if sort == "desc"
+                        else workflow_key <= after_key
+                    ),
+                ),
+                has_next=bool(size) and len(next_workflow_ids) > size,
+            )
+        elif before:
+            # seek backwards from the cursor, fetching one extra workflow to
+            # know whether there is a previous page
+            before_key = tuple_(*decode_workflow_cursor(before))
+            reverse_sort = "asc" if sort == "desc" else "desc"
+            previous_workflow_ids = [
+                workflow_id
+                for (workflow_id,) in query.filter(
+                    workflow_key > before_key
+                    if sort == "desc"
+                    else workflow_key < before_key
+                )
+                .with_entities(Workflow.id_)
+                .order_by(None)
+                .order_by(
+                    getattr(Workflow.created, reverse_sort)(),
+                    getattr(Workflow.id_, reverse_sort)(),
+                )
+                .limit(size + 1 if size else None)
+            ]
+            pagination_dict = paginate(
+                query.filter(Workflow.id_.in_(previous_workflow_ids[:size])),
+                total=total,
+            )
+            pagination_dict.update(
+                has_prev=bool(size) and len(previous_workflow_ids) > size,
+                # the cursor may point at the first workflow, in which case the
+                # page is empty, or at a deleted one with nothing after it
+                has_next=bool(previous_workflow_ids)
+                and _has_workflows(
+                    query,
+                    (
+                        workflow_key <= before_key
+                        if sort == "desc"
+                        else workflow_key >= before_key
+                    ),
+                ),
+            )
+        else:
+            pagination_dict = paginate(query, total=total)
+
+        # let polling clients revalidate their listing with ``If-None-Match``,
+        # answering unchanged pages before loading and serializing them
+        page_workflow_ids = [
+            workflow_id
+            for (workflow_id,) in pagination_dict["items"].with_entities(Workflow.id_)
+        ]
+        etag = _get_workflows_etag(
+            page_workflow_ids,
+            include_progress,
+            sorted(request.args.items(multi=True)),
+            total,
+            last_update,
+            user_has_workflows,
+            pagination_dict["has_prev"],
+            pagination_dict["has_next"],
         )
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+            response.set_etag(etag, weak=True)
+            return response
 
         workflows = []
-        for workflow in pagination_dict["items"]:
-            owner_email = owners[workflow.owner_id]
-            if workflow.owner_id == user.id_:
-                shared_with = [
-                    user.email
-                    for user in workflow.users_it_is_shared_with.with_entities(
-                        User.email
-                    )
-                ]
-            else:
-                shared_with = []
-
-            workflow_response = {
-                "id": workflow.id_,
-                "name": get_workflow_name(workflow),
-                "status": workflow.status.name,
-                "user": user_uuid,
-                "launcher_url": workflow.launcher_url,
-                "created": workflow.created.strftime(WORKFLOW_TIME_FORMAT),
-                "progress": get_workflow_progress(
-                    workflow, include_progress=include_progress
-                ),
-                "owner_email": owner_email,
-                "shared_with": shared_with,
-            }
-            if type_ == "interactive" or verbose:
-                int_session = workflow.sessions.first()
-                if int_session:
-                    workflow_response["session_type"] = int_session.type_.name
-                    workflow_response["session_uri"] = int_session.path
-                    workflow_response["session_status"] = int_session.status.name
-                # Skip workflow if type is interactive and there is no session
-                elif type_ == "interactive":
-                    continue
-            empty_disk_usage = {
-                "human_readable": "",
-                "raw": -1,
-            }
-            if include_workspace_size:
-                workflow_response["size"] = (
-                    workflow.get_quota_usage()
-                    .get("disk", {})
-                    .get("usage", empty_disk_usage)
+        first_workflow = last_workflow = None
+        # process large pages in chunks, to bound the number of loaded entities
+        page_workflows = iter(
+            pagination_dict["items"].yield_per(WORKFLOWS_LISTING_CHUNK_SIZE)
+        )
+        while chunk := list(islice(page_workflows, WORKFLOWS_LISTING_CHUNK_SIZE)):
+            chunk_workflow_ids = [workflow.id_ for workflow in chunk]
+            owners = _get_owner_emails(
+                user, chunk, shared_by if shared_by != "anybody" else None
+            )
+            shared_with_emails = _get_shared_with_emails(
+                [workflow.id_ for workflow in chunk if workflow.owner_id == user.id_]
+            )
+            interactive_sessions = (
+                _get_interactive_sessions(chunk_workflow_ids)
+                if type_ == "interactive" or verbose
+                else {}
+            )
+            disk_usage = (
+                _get_workspace_disk_usage(chunk_workflow_ids)
+                if include_workspace_size
+                else {}
+            )
+            most_recent_jobs = (
+                get_most_recent_jobs_info(chunk_workflow_ids)
+                if include_progress
+                else {}
+            )
+
+            for workflow in chunk:
+                first_workflow = first_workflow or workflow
+                last_workflow = workflow
+                owner_email = owners[workflow.owner_id]
+                shared_with = shared_with_emails.get(workflow.id_, [])
+
+                workflow_response = {
+                    "id": workflow.id_,
+                    "name": get_workflow_name(workflow),
+                    "status": workflow.status.name,
+                    "user": user_uuid,
+                    "launcher_url": workflow.launcher_url,
+                    "created": format_workflow_time(workflow.created),
+                    "progress": get_workflow_progress(
+                        workflow,
+                        include_progress=include_progress,
+                        most_recent_job_info=most_recent_jobs.get(workflow.id_, {}),
+                    ),
+                    "owner_email": owner_email,
+                    "shared_with": shared_with,
+                }
+                if type_ == "interactive" or verbose:
+                    int_session = interactive_sessions.get(workflow.id_)
+                    if int_session:
+                        workflow_response["session_type"] = int_session.type_.name
+                        workflow_response["session_uri"] = int_session.path
+                        workflow_response["session_status"] = int_session.status.name
+                    # Skip workflow if type is interactive and there is no session
+                    elif type_ == "interactive":
+                        continue
+                empty_disk_usage = {
+                    "human_readable": "",
+                    "raw": -1,
+                }
+                workflow_response["size"] = disk_usage.get(
+                    workflow.id_, empty_disk_usage
                 )
-            else:
-                workflow_response["size"] = empty_disk_usage
-            workflows.append(workflow_response)
+                workflows.append(workflow_response)
         pagination_dict["items"] = workflows
-        pagination_dict["user_has_workflows"] = user.workflows.first() is not None
-        return jsonify(pagination_dict), 200
+        # cursors point at the first and last workflows of the page, so they
+        # can only be built when the page is not empty
+        pagination_dict["next_cursor"] = (
+            encode_workflow_cursor(last_workflow)
+            if pagination_dict["has_next"]
+            and last_workflow is not None
+            and sort in ["asc", "desc"]
+            else None
+        )
+        pagination_dict["prev_cursor"] = (
+            encode_workflow_cursor(first_workflow)
+            if pagination_dict["has_prev"]
+            and first_workflow is not None
+            and sort in ["asc", "desc"]
+            else None
+        )
+        pagination_dict["user_has_workflows"] = user_has_workflows
+        response = jsonify(pagination_dict)
+        response.set_etag(etag, weak=True)
+        return response
     except (ValueError, KeyError):
         return jsonify({"message": "Malformed request."}), 400
-    except json.JSONDecodeError:
-        return jsonify({"message": "Your request contains not valid JSON."}), 400
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -527,12 +979,10 @@ def create_workflow():  # noqa
     """
     try:
         user_uuid = request.args["user"]
-        user = User.query.filter(User.id_ == user_uuid).first()
-        if not user:
+        user_id = Session.query(User.id_).filter(User.id_ == user_uuid).scalar()
+        if not user_id:
             return (
-                jsonify(
-                    {"message": "User with id:{} does not exist".format(user_uuid)}
-                ),
+                jsonify({"message": f"User with id:{user_uuid} does not exist"}),
                 404,
             )
         workflow_uuid = str(uuid4())
@@ -541,14 +991,8 @@ def create_workflow():  # noqa
         workflow_name = request.json.get("workflow_name", "")
         if workflow_name == "":
             workflow_name = DEFAULT_NAME_FOR_WORKFLOWS
-        else:
-            try:
-                workflow_name.encode("ascii")
-            except UnicodeEncodeError:
-                # `workflow_name` contains something else than just ASCII.
-                raise REANAWorkflowNameError(
-                    "Workflow name {} is not valid.".format(workflow_name)
-                )
+        elif not workflow_name.isascii():
+            raise REANAWorkflowNameError(f"Workflow name {workflow_name} is not valid.")
         git_ref = ""
         git_repo = ""
         if "git_data" in request.json:
@@ -573,21 +1017,31 @@ def create_workflow():  # noqa
             ),
             launcher_url=request.json.get("launcher_url"),
         )
-        Session.add(workflow)
-        Session.object_session(workflow).commit()
-        retention_rules = request.json.get("retention_rules", [])
-        if retention_rules:
-            workflow.set_workspace_retention_rules(retention_rules)
+        workspace_kwargs = {}
         if git_ref:
-            create_workflow_workspace(
-                workflow.workspace_path,
-                user_id=user.id_,
+            workspace_kwargs = dict(
+                user_id=user_id,
                 git_url=git_data["git_url"],
                 git_branch=git_data["git_branch"],
                 git_ref=git_ref,
             )
-        else:
-            create_workflow_workspace(workflow.workspace_path)
+        # The workspace (possibly a git clone) is created while the workflow is
+        # being committed, so that filesystem and DB I/O overlap.
+        workspace_creation = _workspace_creation_executor.submit(
+            create_workflow_workspace, workflow.workspace_path, **workspace_kwargs
+        )
+        try:
+            Session.add(workflow)
+            # the retention rules are committed together with the workflow
+            workflow.set_workspace_retention_rules(
+                request.json.get("retention_rules", [])
+            )
+        except Exception:
+            Session.rollback()
+            wait([workspace_creation])
+            remove_workflow_workspace(workflow.workspace_path)
+            raise
+        workspace_creation.result()
         return (
             jsonify(
                 {
@@ -712,10 +1166,10 @@ def get_workflow_parameters(workflow_id_or_name):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -824,49 +1278,53 @@ def get_workflow_diff(workflow_id_or_name_a, workflow_id_or_name_b):  # noqa
     """
     try:
         user_uuid = request.args["user"]
-        brief = json.loads(request.args.get("brief", "false").lower())
-        context_lines = request.args.get("context_lines", 5)
+        brief = request.args.get("brief", "false").strip().lower()
+        brief = brief in ("true", "1", "yes")
+        context_lines = request.args.get("context_lines", 5, type=int)
 
-        workflow_a_exists = False
-        workflow_a = _get_workflow_with_uuid_or_name(
-            workflow_id_or_name_a, user_uuid, True
-        )
-        workflow_a_exists = True
-        workflow_b = _get_workflow_with_uuid_or_name(
-            workflow_id_or_name_b, user_uuid, True
-        )
         if not workflow_id_or_name_a or not workflow_id_or_name_b:
-            raise ValueError("Workflow id or name is not supplied")
+            return jsonify({"message": "Workflow id or name is not supplied."}), 400
+
+        workflows = []
+        for workflow_id_or_name in (workflow_id_or_name_a, workflow_id_or_name_b):
+            try:
+                workflows.append(
+                    get_workflow_with_uuid_or_name_cached(
+                        workflow_id_or_name, user_uuid, True
+                    )
+                )
+            except ValueError:
+                message = f"Workflow {workflow_id_or_name} does not exist."
+                return jsonify({"message": message}), 404
+        workflow_a, workflow_b = workflows
+        # The workspaces are compared in the background while the
+        # specifications are compared, so that both diffs overlap. Only plain
+        # values are passed, as the workflows are bound to this thread's session.
+        workspace_diff_future = _workspace_diff_executor.submit(
+            diff_workspaces,
+            workflow_a.workspace_path,
+            get_workflow_name(workflow_a),
+            workflow_b.workspace_path,
+            get_workflow_name(workflow_b),
+            brief,
+            context_lines,
+        )
         specification_diff = get_specification_diff(workflow_a, workflow_b)
 
         try:
-            workspace_diff = get_workspace_diff(
-                workflow_a, workflow_b, brief, context_lines
-            )
+            workspace_diff = workspace_diff_future.result()
         except ValueError as e:
             workspace_diff = str(e)
 
         response = {
-            "reana_specification": json.dumps(specification_diff),
-            "workspace_listing": json.dumps(workspace_diff),
+            "reana_specification": orjson.dumps(specification_diff).decode(),
+            "workspace_listing": orjson.dumps(workspace_diff).decode(),
         }
-        return jsonify(response)
+        return jsonify(response), 200
     except REANAWorkflowControllerError as e:
         return jsonify({"message": str(e)}), 409
-    except ValueError:
-        wrong_workflow = (
-            workflow_id_or_name_b if workflow_a_exists else workflow_id_or_name_a
-        )
-        return (
-            jsonify({"message": "Workflow {0} does not exist.".format(wrong_workflow)}),
-            404,
-        )
     except KeyError as e:
         return jsonify({"message": str(e)}), 400
-    except ValueError as e:
-        return jsonify({"message": str(e)}), 400
-    except json.JSONDecodeError:
-        return jsonify({"message": "Your request contains not valid JSON."}), 400
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -966,23 +1424,65 @@ def get_workflow_retention_rules(workflow_id_or_name: str, user: str):
               }
     """
     try:
-        workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user, True)
-
-        rules = workflow.retention_rules.all()
+        try:
+            workflow = get_workflow_with_uuid_or_name_cached(
+                workflow_id_or_name, user, True
+            )
+        except ValueError as e:
+            logging.exception(str(e))
+            return jsonify({"message": str(e)}), 404
+
+        # same format as `WorkspaceRetentionRule.serialize`, without loading entities
+        rules = Session.query(
+            WorkspaceRetentionRule.id_,
+            WorkspaceRetentionRule.workspace_files,
+            WorkspaceRetentionRule.retention_days,
+            WorkspaceRetentionRule.apply_on,
+            WorkspaceRetentionRule.status,
+        ).filter(WorkspaceRetentionRule.workflow_id == workflow.id_)
         response = {
             "workflow_id": workflow.id_,
             "workflow_name": workflow.get_full_workflow_name(),
-            "retention_rules": [rule.serialize() for rule in rules],
+            "retention_rules": [
+                {
+                    "id": str(rule.id_),
+                    "workspace_files": rule.workspace_files,
+                    "retention_days": rule.retention_days,
+                    "apply_on": (
+                        format_workflow_time(rule.apply_on) if rule.apply_on else None
+                    ),
+                    "status": rule.status.name,
+                }
+                for rule in rules
+            ],
         }
         return jsonify(response), 200
-    except ValueError as e:
-        logging.exception(str(e))
-        return jsonify({"message": str(e)}), 404
     except Exception as e:
         logging.exception(str(e))
         return jsonify({"message": str(e)}), 500
 
 
+def _get_sharer_and_user_with_email(
+    sharer_id: str, email: str
+) -> Tuple[Optional[User], Optional[User]]:
+    """Look up the sharing user and the user with the given email in one query.
+
+    :param sharer_id: UUID of the user sharing (or unsharing) a workflow.
+    :param email: Email of the user the workflow is (un)shared with.
+    :return: Tuple with the sharing user and the user with the given email,
+        each of them being ``None`` if it does not exist.
+    """
+    sharer, user_with_email = None, None
+    for user in Session.query(User).filter(
+        or_(User.id_ == sharer_id, User.email == email)
+    ):
+        if user.id_ == UUID(sharer_id):
+            sharer = user
+        if user.email == email:
+            user_with_email = user
+    return sharer, user_with_email
+
+
 @blueprint.route("/workflows/<workflow_id_or_name>/share", methods=["POST"])
 @use_kwargs({"user": fields.Str(required=True)}, location="query")
 @use_kwargs(
@@ -1096,7 +1596,9 @@ def share_workflow(
     valid_until = kwargs.get("valid_until")
 
     try:
-        sharer = User.query.filter(User.id_ == user).first()
+        sharer, user_to_share_with = _get_sharer_and_user_with_email(
+            user, user_email_to_share_with
+        )
         if not sharer:
             return (
                 jsonify({"message": f"User with id '{user}' does not exist."}),
@@ -1104,13 +1606,8 @@ def share_workflow(
             )
 
         if sharer.email == user_email_to_share_with:
-            raise ValueError("Unable to share a workflow with yourself.")
-
-        user_to_share_with = (
-            Session.query(User)
-            .filter(User.email == user_email_to_share_with)
-            .one_or_none()
-        )
+            message = "Unable to share a workflow with yourself."
+            return jsonify({"message": message}), 400
 
         if not user_to_share_with:
             return (
@@ -1123,22 +1620,29 @@ def share_workflow(
             )
 
         if valid_until and valid_until < datetime.date.today():
-            raise ValueError("The 'valid_until' date cannot be in the past.")
-
-        workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, sharer.id_)
+            message = "The 'valid_until' date cannot be in the past."
+            return jsonify({"message": message}), 400
 
         try:
-            Session.add(
-                UserWorkflow(
-                    user_id=user_to_share_with.id_,
-                    workflow_id=workflow.id_,
-                    message=message,
-                    valid_until=valid_until,
-                )
+            workflow = get_workflow_with_uuid_or_name_cached(
+                workflow_id_or_name, sharer.id_
             )
-            Session.commit()
-        except IntegrityError:
-            Session.rollback()
+        except ValueError as e:
+            logging.exception(str(e))
+            return jsonify({"message": str(e)}), 400
+
+        shared = Session.execute(
+            insert(UserWorkflow)
+            .values(
+                user_id=user_to_share_with.id_,
+                workflow_id=workflow.id_,
+                message=message,
+                valid_until=valid_until,
+            )
+            .on_conflict_do_nothing()
+        )
+        Session.commit()
+        if not shared.rowcount:
             return (
                 jsonify(
                     {
@@ -1154,9 +1658,6 @@ def share_workflow(
             "workflow_name": workflow.get_full_workflow_name(),
         }
         return jsonify(response), 200
-    except ValueError as e:
-        logging.exception(str(e))
-        return jsonify({"message": str(e)}), 400
     except Exception as e:
         logging.exception(str(e))
         return jsonify({"message": str(e)}), 500
@@ -1288,37 +1789,41 @@ def unshare_workflow(
               }
     """
     try:
-        sharer = User.query.filter(User.id_ == user).first()
+        sharer, user_to_unshare_with = _get_sharer_and_user_with_email(
+            user, user_email_to_unshare_with
+        )
         if not sharer:
             return (
-                jsonify({"message": f"User with id '{sharer}' does not exist."}),
+                jsonify({"message": f"User with id '{user}' does not exist."}),
                 404,
             )
 
         if sharer.email == user_email_to_unshare_with:
-            raise ValueError("Unable to unshare a workflow with yourself.")
-
-        user_to_unshare_with = (
-            Session.query(User).filter(User.email == user_email_to_unshare_with).first()
-        )
+            message = "Unable to unshare a workflow with yourself."
+            return jsonify({"message": message}), 400
 
         if not user_to_unshare_with:
             message = f"User with email '{user_email_to_unshare_with}' does not exist."
             return jsonify({"message": message}), 404
 
-        workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, str(sharer.id_))
+        try:
+            workflow = get_workflow_with_uuid_or_name_cached(
+                workflow_id_or_name, str(sharer.id_)
+            )
+        except ValueError as e:
+            logging.exception(str(e))
+            return jsonify({"message": str(e)}), 400
 
-        existing_share = (
+        deleted_shares = (
             Session.query(UserWorkflow)
             .filter_by(user_id=user_to_unshare_with.id_, workflow_id=workflow.id_)
-            .first()
+            .delete(synchronize_session=False)
         )
 
-        if not existing_share:
+        if not deleted_shares:
             message = f"{workflow.get_full_workflow_name()} is not shared with {user_email_to_unshare_with}."
             return (jsonify({"message": message}), 409)
 
-        Session.delete(existing_share)
         Session.commit()
 
         response = {
@@ -1328,9 +1833,6 @@ def unshare_workflow(
         }
 
         return jsonify(response), 200
-    except ValueError as e:
-        logging.exception(str(e))
-        return jsonify({"message": str(e)}), 400
     except Exception as e:
         logging.exception(str(e))
         return jsonify({"message": str(e)}), 500
@@ -1424,13 +1926,16 @@ def get_workflow_share_status(
               }
     """
     try:
-        workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user)
+        try:
+            workflow = get_workflow_with_uuid_or_name_cached(workflow_id_or_name, user)
+        except ValueError as e:
+            logging.exception(str(e))
+            return jsonify({"message": str(e)}), 404
 
         shared_with = (
-            Session.query(UserWorkflow)
-            .filter_by(workflow_id=workflow.id_)
-            .join(User, User.id_ == UserWorkflow.user_id)
-            .with_entities(User.email, UserWorkflow.valid_until)
+            Session.query(User.email, UserWorkflow.valid_until)
+            .join(UserWorkflow, User.id_ == UserWorkflow.user_id)
+            .filter(UserWorkflow.workflow_id == workflow.id_)
             .all()
         )
 
@@ -1441,7 +1946,7 @@ def get_workflow_share_status(
                 {
                     "user_email": share.email,
                     "valid_until": (
-                        share.valid_until.strftime(WORKFLOW_TIME_FORMAT)
+                        format_workflow_time(share.valid_until)
                         if share.valid_until
                         else None
                     ),
@@ -1451,9 +1956,6 @@ def get_workflow_share_status(
         }
 
         return jsonify(response), 200
-    except ValueError as e:
-        logging.exception(str(e))
-        return jsonify({"message": str(e)}), 404
     except Exception as e:
         logging.exception(str(e))
         return jsonify({"message": str(e)}), 500
@@ -136,7 +136,7 @@ def open_interactive_session(
             interactive_session_type,
             image=kwargs.get("image"),
         )
-        return jsonify({"path": str(access_path)}), 200
+        return jsonify({"path": access_path}), 200
 
     except (KeyError, ValueError) as e:
         status_code = 400 if workflow else 404
@@ -215,9 +215,8 @@ def close_interactive_session(workflow_id_or_name):  # noqa
             return (
                 jsonify(
                     {
-                        "message": "Workflow - {} has no open interactive session.".format(
-                            workflow_id_or_name
-                        )
+                        "message": f"Workflow - {workflow_id_or_name} has no "
+                        "open interactive session."
                     }
                 ),
                 404,
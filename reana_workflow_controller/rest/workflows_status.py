@@ -8,8 +8,7 @@
 
 """REANA Workflow Controller status REST API."""
 
-import json
-
+import orjson
 from flask import Blueprint, jsonify, request
 
 from reana_commons.config import WORKFLOW_TIME_FORMAT
@@ -27,15 +26,16 @@ from reana_workflow_controller.rest.utils import (
     delete_workflow,
     get_workflow_name,
     get_workflow_progress,
+    gzip_response,
     start_workflow,
     stop_workflow,
+    truncate_workflow_logs,
     use_paginate_args,
 )
 
 START = "start"
 STOP = "stop"
 DELETED = "deleted"
-STATUSES = {START, STOP, DELETED}
 
 blueprint = Blueprint("statuses", __name__)
 
@@ -85,6 +85,14 @@ def get_workflow_logs(workflow_id_or_name, paginate=None, **kwargs):  # noqa
           description: Number of results per page (pagination).
           required: false
           type: integer
+        - name: depth
+          in: query
+          description: >-
+            Optional. Number of nesting levels of the logs to return. Deeper
+            objects and arrays are replaced by the string "<truncated>".
+            All levels are returned by default.
+          required: false
+          type: integer
       responses:
         200:
           description: >-
@@ -140,7 +148,17 @@ def get_workflow_logs(workflow_id_or_name, paginate=None, **kwargs):  # noqa
               }
     """
     try:
-        user_uuid = request.args["user"]
+        user_uuid = request.args.get("user")
+        if not user_uuid:
+            return jsonify({"message": "User UUID is not supplied."}), 400
+        depth = request.args.get("depth")
+        if depth is not None:
+            if not (depth.isascii() and depth.isdigit()):
+                return (
+                    jsonify({"message": "Depth must be a non-negative integer."}),
+                    400,
+                )
+            depth = int(depth)
 
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid, True)
 
@@ -171,33 +189,31 @@ def get_workflow_logs(workflow_id_or_name, paginate=None, **kwargs):  # noqa
                 "job_logs": build_workflow_logs(workflow, paginate=paginate),
                 "engine_specific": workflow.engine_specific,
             }
-        return (
-            jsonify(
-                {
-                    "workflow_id": workflow.id_,
-                    "workflow_name": get_workflow_name(workflow),
-                    "logs": json.dumps(workflow_logs),
-                    "user": user_uuid,
-                    "live_logs_enabled": REANA_OPENSEARCH_ENABLED,
-                }
-            ),
-            200,
+        if depth is not None:
+            workflow_logs = truncate_workflow_logs(workflow_logs, depth)
+        response = jsonify(
+            {
+                "workflow_id": workflow.id_,
+                "workflow_name": get_workflow_name(workflow),
+                "logs": orjson.dumps(workflow_logs, default=str).decode(),
+                "user": user_uuid,
+                "live_logs_enabled": REANA_OPENSEARCH_ENABLED,
+            }
         )
+        return gzip_response(response)
 
     except ValueError:
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
         )
-    except KeyError as e:
-        return jsonify({"message": str(e)}), 400
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -225,6 +241,14 @@ def get_workflow_status(workflow_id_or_name):  # noqa
           description: Required. Workflow UUID or name.
           required: true
           type: string
+        - name: include_logs
+          in: query
+          description: >-
+            Optional. Whether to include the job logs in the response.
+            Defaults to true. Pollers only interested in the status and
+            progress of the workflow can set it to false.
+          required: false
+          type: boolean
       responses:
         200:
           description: >-
@@ -294,9 +318,13 @@ def get_workflow_status(workflow_id_or_name):  # noqa
     """
 
     try:
-        user_uuid = request.args["user"]
+        user_uuid = request.args.get("user")
+        if not user_uuid:
+            return jsonify({"message": "User UUID is not supplied."}), 400
+        include_logs = request.args.get("include_logs", "true").strip().lower()
+        include_logs = include_logs not in ("false", "0", "no")
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid, True)
-        workflow_logs = build_workflow_logs(workflow)
+        workflow_logs = build_workflow_logs(workflow) if include_logs else {}
 
         return (
             jsonify(
@@ -307,7 +335,7 @@ def get_workflow_status(workflow_id_or_name):  # noqa
                     "status": workflow.status.name,
                     "progress": get_workflow_progress(workflow, include_progress=True),
                     "user": user_uuid,
-                    "logs": json.dumps(workflow_logs),
+                    "logs": orjson.dumps(workflow_logs, default=str).decode(),
                 }
             ),
             200,
@@ -316,20 +344,76 @@ def get_workflow_status(workflow_id_or_name):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
         )
-    except KeyError as e:
-        return jsonify({"message": str(e)}), 400
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
 
+def _start_workflow(workflow, parameters):
+    """Start the workflow and return the response of the status endpoint."""
+    start_workflow(workflow, parameters)
+    return (
+        jsonify(
+            {
+                "message": "Workflow successfully launched",
+                "workflow_id": str(workflow.id_),
+                "workflow_name": get_workflow_name(workflow),
+                "status": workflow.status.name,
+                "user": str(workflow.owner_id),
+            }
+        ),
+        200,
+    )
+
+
+def _stop_workflow(workflow, parameters):
+    """Stop the workflow and return the response of the status endpoint."""
+    stop_workflow(workflow)
+    return (
+        jsonify(
+            {
+                "message": "Workflow successfully stopped",
+                "workflow_id": workflow.id_,
+                "workflow_name": get_workflow_name(workflow),
+                "status": workflow.status.name,
+                "user": str(workflow.owner_id),
+            }
+        ),
+        200,
+    )
+
+
+def _delete_workflow(workflow, parameters):
+    """Delete the workflow and return the response of the status endpoint."""
+    all_runs = True if parameters.get("all_runs") else False
+    workspace = True if parameters.get("workspace", True) else False
+    if not workspace:
+        return (
+            jsonify(
+                {
+                    "message": "Workspace must always be deleted when deleting a workflow.",
+                }
+            ),
+            400,
+        )
+    return delete_workflow(workflow, all_runs, workspace)
+
+
+_SET_WORKFLOW_STATUS_HANDLERS = {
+    START: _start_workflow,
+    STOP: _stop_workflow,
+    DELETED: _delete_workflow,
+}
+_STATUSES_JOINED = ", ".join(_SET_WORKFLOW_STATUS_HANDLERS)
+
+
 @blueprint.route("/workflows/<workflow_id_or_name>/status", methods=["PUT"])
 def set_workflow_status(workflow_id_or_name):  # noqa
     r"""Set workflow status.
@@ -454,14 +538,6 @@ def set_workflow_status(workflow_id_or_name):  # noqa
         500:
           description: >-
             Request failed. Internal controller error.
-        501:
-          description: >-
-            Request failed. The specified status change is not implemented.
-          examples:
-            application/json:
-              {
-                "message": "Status resume is not supported yet."
-              }
         502:
           description: >-
             Request failed. Connection to a third party system has failed.
@@ -473,17 +549,15 @@ def set_workflow_status(workflow_id_or_name):  # noqa
     """
 
     try:
-        user_uuid = request.args["user"]
+        user_uuid = request.args.get("user")
+        if not user_uuid:
+            return jsonify({"message": "User UUID is not supplied."}), 400
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid)
         status = request.args.get("status")
-        if not (status in STATUSES):
+        if status not in _SET_WORKFLOW_STATUS_HANDLERS:
             return (
                 jsonify(
-                    {
-                        "message": "Status {0} is not one of: {1}".format(
-                            status, ", ".join(STATUSES)
-                        )
-                    }
+                    {"message": f"Status {status} is not one of: {_STATUSES_JOINED}"}
                 ),
                 400,
             )
@@ -491,57 +565,15 @@ def set_workflow_status(workflow_id_or_name):  # noqa
         parameters = {}
         if request.is_json:
             parameters = request.json
-        if status == START:
-            start_workflow(workflow, parameters)
-            return (
-                jsonify(
-                    {
-                        "message": "Workflow successfully launched",
-                        "workflow_id": str(workflow.id_),
-                        "workflow_name": get_workflow_name(workflow),
-                        "status": workflow.status.name,
-                        "user": str(workflow.owner_id),
-                    }
-                ),
-                200,
-            )
-        elif status == DELETED:
-            all_runs = True if request.json.get("all_runs") else False
-            workspace = True if request.json.get("workspace", True) else False
-            if not workspace:
-                return (
-                    jsonify(
-                        {
-                            "message": "Workspace must always be deleted when deleting a workflow.",
-                        }
-                    ),
-                    400,
-                )
-            return delete_workflow(workflow, all_runs, workspace)
-        if status == STOP:
-            stop_workflow(workflow)
-            return (
-                jsonify(
-                    {
-                        "message": "Workflow successfully stopped",
-                        "workflow_id": workflow.id_,
-                        "workflow_name": get_workflow_name(workflow),
-                        "status": workflow.status.name,
-                        "user": str(workflow.owner_id),
-                    }
-                ),
-                200,
-            )
-        else:
-            raise NotImplementedError("Status {} is not supported yet".format(status))
+        return _SET_WORKFLOW_STATUS_HANDLERS[status](workflow, parameters)
     except ValueError:
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -552,8 +584,6 @@ def set_workflow_status(workflow_id_or_name):  # noqa
         return jsonify({"message": str(e)}), 404
     except (REANASecretDoesNotExist, KeyError) as e:
         return jsonify({"message": str(e)}), 400
-    except NotImplementedError as e:
-        return jsonify({"message": str(e)}), 501
     except REANAExternalCallError as e:
         return jsonify({"message": str(e)}), 502
     except Exception as e:
@@ -152,9 +152,7 @@ def upload_file(workflow_id_or_name):
         store_workflow_disk_quota(workflow, bytes_to_sum=request.content_length)
         update_users_disk_quota(workflow.owner, bytes_to_sum=request.content_length)
         return (
-            jsonify(
-                {"message": "{} has been successfully uploaded.".format(full_file_name)}
-            ),
+            jsonify({"message": f"{full_file_name} has been successfully uploaded."}),
             200,
         )
 
@@ -162,10 +160,10 @@ def upload_file(workflow_id_or_name):
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment"
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -250,7 +248,7 @@ def download_file(workflow_id_or_name, file_name):  # noqa
         user_uuid = request.args["user"]
         user = User.query.filter(User.id_ == user_uuid).first()
         if not user:
-            return jsonify({"message": "User {} does not exist".format(user)}), 404
+            return jsonify({"message": f"User {user} does not exist"}), 404
 
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid, True)
         workflow_name = workflow.get_full_workflow_name()
@@ -263,10 +261,10 @@ def download_file(workflow_id_or_name, file_name):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -276,7 +274,7 @@ def download_file(workflow_id_or_name, file_name):  # noqa
     except REANAWorkspaceError as e:
         return jsonify({"message": str(e)}), 400
     except NotFound:
-        return jsonify({"message": "{0} does not exist.".format(file_name)}), 404
+        return jsonify({"message": f"{file_name} does not exist."}), 404
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -339,7 +337,7 @@ def delete_file(workflow_id_or_name, file_name):  # noqa
         user_uuid = request.args["user"]
         user = User.query.filter(User.id_ == user_uuid).first()
         if not user:
-            return jsonify({"message": "User {} does not exist".format(user)}), 404
+            return jsonify({"message": f"User {user} does not exist"}), 404
 
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid)
         deleted = remove_files_recursive_wildcard(workflow.workspace_path, file_name)
@@ -355,10 +353,10 @@ def delete_file(workflow_id_or_name, file_name):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -368,9 +366,9 @@ def delete_file(workflow_id_or_name, file_name):  # noqa
     except REANAWorkspaceError as e:
         return jsonify({"message": str(e)}), 400
     except NotFound:
-        return jsonify({"message": "{0} does not exist.".format(file_name)}), 404
+        return jsonify({"message": f"{file_name} does not exist."}), 404
     except OSError:
-        return jsonify({"message": "Error while deleting {}.".format(file_name)}), 500
+        return jsonify({"message": f"Error while deleting {file_name}."}), 500
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -472,7 +470,7 @@ def get_files(workflow_id_or_name, paginate=None):  # noqa
         search = request.args.get("search")
         user = User.query.filter(User.id_ == user_uuid).first()
         if not user:
-            return jsonify({"message": "User {} does not exist".format(user)}), 404
+            return jsonify({"message": f"User {user} does not exist"}), 404
 
         workflow = _get_workflow_with_uuid_or_name(workflow_id_or_name, user_uuid, True)
         file_name = request.args.get("file_name")
@@ -491,10 +489,10 @@ def get_files(workflow_id_or_name, paginate=None):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
@@ -603,7 +601,7 @@ def move_files(workflow_id_or_name):  # noqa
         target = request.args["target"]
 
         mv_files(source, target, workflow)
-        message = "File(s) {} were successfully moved".format(source)
+        message = f"File(s) {source} were successfully moved"
 
         return (
             jsonify(
@@ -620,10 +618,10 @@ def move_files(workflow_id_or_name):  # noqa
         return (
             jsonify(
                 {
-                    "message": "REANA_WORKON is set to {0}, but "
+                    "message": f"REANA_WORKON is set to {workflow_id_or_name}, but "
                     "that workflow does not exist. "
                     "Please set your REANA_WORKON environment "
-                    "variable appropriately.".format(workflow_id_or_name)
+                    "variable appropriately."
                 }
             ),
             404,
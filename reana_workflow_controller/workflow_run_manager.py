@@ -158,7 +158,7 @@ class WorkflowRunManager:
 
     engine_mapping = {
         "cwl": {
-            "image": "{}".format(REANA_WORKFLOW_ENGINE_IMAGE_CWL),
+            "image": f"{REANA_WORKFLOW_ENGINE_IMAGE_CWL}",
             "command": (
                 "run-cwl-workflow "
                 "--workflow-uuid {id} "
@@ -172,7 +172,7 @@ class WorkflowRunManager:
             + WORKFLOW_ENGINE_CWL_ENV_VARS,
         },
         "yadage": {
-            "image": "{}".format(REANA_WORKFLOW_ENGINE_IMAGE_YADAGE),
+            "image": f"{REANA_WORKFLOW_ENGINE_IMAGE_YADAGE}",
             "command": (
                 "run-yadage-workflow "
                 "--workflow-uuid {id} "
@@ -186,7 +186,7 @@ class WorkflowRunManager:
             + WORKFLOW_ENGINE_YADAGE_ENV_VARS,
         },
         "serial": {
-            "image": "{}".format(REANA_WORKFLOW_ENGINE_IMAGE_SERIAL),
+            "image": f"{REANA_WORKFLOW_ENGINE_IMAGE_SERIAL}",
             "command": (
                 "run-serial-workflow "
                 "--workflow-uuid {id} "
@@ -199,7 +199,7 @@ class WorkflowRunManager:
             + WORKFLOW_ENGINE_SERIAL_ENV_VARS,
         },
         "snakemake": {
-            "image": "{}".format(REANA_WORKFLOW_ENGINE_IMAGE_SNAKEMAKE),
+            "image": f"{REANA_WORKFLOW_ENGINE_IMAGE_SNAKEMAKE}",
             "command": (
                 "run-snakemake-workflow "
                 "--workflow-uuid {id} "
@@ -231,7 +231,7 @@ class WorkflowRunManager:
 
     def _generate_interactive_workflow_path(self):
         """Generate the path to access the interactive workflow."""
-        return "/{}".format(self.workflow.id_)
+        return f"/{self.workflow.id_}"
 
     def _get_merged_workflow_input_parameters(self, overwrite=None):
         """Return workflow input parameters merged with live ones, if given."""
@@ -405,7 +405,7 @@ class KubernetesWorkflowRunManager(WorkflowRunManager):
                 create_cvmfs_persistent_volume_claim()
 
         except ApiException as e:
-            msg = "Workflow engine/job controller pod " "creation failed {}".format(e)
+            msg = f"Workflow engine/job controller pod creation failed {e}"
             logging.error(msg, exc_info=True)
             raise e
 
@@ -470,19 +470,17 @@ class KubernetesWorkflowRunManager(WorkflowRunManager):
         except KeyError:
             action_completed = False
             raise REANAInteractiveSessionError(
-                "Unsupported interactive session type {}.".format(
-                    interactive_session_type
-                )
+                f"Unsupported interactive session type {interactive_session_type}."
             )
         except ApiException as api_exception:
             action_completed = False
             raise REANAInteractiveSessionError(
-                "Connection to Kubernetes has failed:\n{}".format(api_exception)
+                f"Connection to Kubernetes has failed:\n{api_exception}"
             )
         except Exception as e:
             action_completed = False
             raise REANAInteractiveSessionError(
-                "Unkown error while starting interactive workflow run:\n{}".format(e)
+                f"Unkown error while starting interactive workflow run:\n{e}"
             )
         finally:
             if not action_completed and kubernetes_objects:
@@ -498,9 +496,7 @@ class KubernetesWorkflowRunManager(WorkflowRunManager):
 
         if not int_session:
             raise REANAInteractiveSessionError(
-                "Interactive session for workflow {} does not exist.".format(
-                    self.workflow.name
-                )
+                f"Interactive session for workflow {self.workflow.name} does not exist."
             )
         action_completed = True
         try:
@@ -511,7 +507,7 @@ class KubernetesWorkflowRunManager(WorkflowRunManager):
         except Exception as e:
             action_completed = False
             raise REANAInteractiveSessionError(
-                "Unkown error while stopping interactive session:\n{}".format(e)
+                f"Unkown error while stopping interactive session:\n{e}"
             )
         finally:
             if action_completed:
@@ -828,14 +824,14 @@ class KubernetesWorkflowRunManager(WorkflowRunManager):
                     gid=WORKFLOW_RUNTIME_USER_GID, name=WORKFLOW_RUNTIME_GROUP_NAME
                 )
             )
-            add_user_cmd = "useradd -u {} -g {} -M {};".format(
-                WORKFLOW_RUNTIME_USER_UID, WORKFLOW_RUNTIME_USER_GID, user
+            add_user_cmd = (
+                f"useradd -u {WORKFLOW_RUNTIME_USER_UID} "
+                f"-g {WORKFLOW_RUNTIME_USER_GID} -M {user};"
             )
-            chown_workspace_cmd = "chown -R {} {};".format(
-                WORKFLOW_RUNTIME_USER_UID,
-                self.workflow.workspace_path,
+            chown_workspace_cmd = (
+                f"chown -R {WORKFLOW_RUNTIME_USER_UID} {self.workflow.workspace_path};"
             )
-            run_app_cmd = 'exec su {} /bin/bash -c "{}"'.format(user, base_cmd)
+            run_app_cmd = f'exec su {user} /bin/bash -c "{base_cmd}"'
             full_cmd = add_group_cmd + add_user_cmd + chown_workspace_cmd + run_app_cmd
             return [full_cmd]
         else:
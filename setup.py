@@ -44,12 +44,13 @@ for key, reqs in extras_require.items():
     extras_require["all"].extend(reqs)
 
 install_requires = [
-    "Flask>=2.1.1,<2.3.0",  # same upper pin as invenio-base/reana-server
+    "Flask>=2.2.0,<2.3.0",  # same upper pin as invenio-base/reana-server
     "Werkzeug>=2.1.0,<2.3.0",  # same upper pin as invenio-base
     "gitpython>=2.1",
     "jsonpickle>=0.9.6",
     "marshmallow>2.13.0,<3.0.0",  # same upper pin as reana-server
     "opensearch-py>=2.7.0,<2.8.0",
+    "orjson>=3.8.0",
     "packaging>=18.0",
     "reana-commons[kubernetes]>=0.95.0a5,<0.96.0",
     "reana-db>=0.95.0a4,<0.96.0",
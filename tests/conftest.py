@@ -23,7 +23,9 @@ from reana_db.models import (
     Base,
     Job,
     JobStatus,
+    RunStatus,
     User,
+    Workflow,
     WorkspaceRetentionAuditLog,
     WorkspaceRetentionRule,
 )
@@ -120,6 +122,45 @@ def add_kubernetes_jobs_to_workflow(session):
     yield add_kubernetes_jobs_to_workflow_callable
 
 
+@pytest.fixture()
+def add_workflow_to_db(session, cwl_workflow_with_name):
+    """Create finished CWL workflows in the database.
+
+    This fixture provides a callable which takes the owner of the workflow to
+    create, and optionally its name and creation date.
+
+    .. code-block:: python
+
+        def test_get_workflows(user0, add_workflow_to_db):
+            workflow = add_workflow_to_db(user0, name="my_analysis")
+    """
+
+    def add_workflow_to_db_callable(owner, name="my_test_workflow", created=None):
+        """Add a finished CWL workflow to the database.
+
+        :param owner: User owning the workflow.
+        :param name: Name of the workflow.
+        :param created: Creation date of the workflow, by default the current
+            date.
+        """
+        workflow = Workflow(
+            id_=uuid.uuid4(),
+            name=name,
+            status=RunStatus.finished,
+            owner_id=owner.id_,
+            reana_specification=cwl_workflow_with_name["reana_specification"],
+            type_=cwl_workflow_with_name["reana_specification"]["type"],
+            logs="",
+        )
+        if created:
+            workflow.created = created
+        session.add(workflow)
+        session.commit()
+        return workflow
+
+    yield add_workflow_to_db_callable
+
+
 @pytest.fixture()
 def sample_serial_workflow_with_retention_rule(session, sample_serial_workflow_in_db):
     """Sample workflow with retention rules."""
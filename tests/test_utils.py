@@ -12,11 +12,13 @@ import os
 import stat
 import uuid
 from contextlib import nullcontext as does_not_raise
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import ContextManager
 
 import mock
 import pytest
+from reana_commons.config import WORKFLOW_TIME_FORMAT
 from reana_db.models import (
     InteractiveSession,
     InteractiveSessionType,
@@ -34,10 +36,15 @@ from reana_workflow_controller.errors import REANAWorkflowControllerError
 from reana_workflow_controller.rest.utils import (
     create_workflow_workspace,
     delete_workflow,
+    format_workflow_time,
+    get_most_recent_jobs_info,
     get_previewable_mime_type,
+    get_workflow_progress,
+    is_uuid_v4,
     list_files_recursive_wildcard,
     mv_files,
     remove_files_recursive_wildcard,
+    truncate_workflow_logs,
 )
 
 
@@ -343,3 +350,119 @@ def test_mv_files(
         assert target_path.exists()
         if source_content:
             assert target_path.read_text() == source_content
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 3, 4, 5, 6, 7),
+        datetime(2024, 12, 31, 23, 59, 59, 999999),
+    ],
+)
+def test_format_workflow_time(value):
+    """Test formatting of workflow dates."""
+    assert format_workflow_time(value) == value.strftime(WORKFLOW_TIME_FORMAT)
+
+
+@pytest.mark.parametrize(
+    "uuid_or_name, expected",
+    [
+        ("256b25f4-4cfb-4684-b7a8-73872ef455a1", True),
+        ("256b25f44cfb4684b7a873872ef455a1", True),
+        ("256B25F4-4CFB-4684-B7A8-73872EF455A1", False),
+        ("{256b25f4-4cfb-4684-b7a8-73872ef455a1}", False),
+        ("256b25f4-4cfb-1684-b7a8-73872ef455a1", False),
+        ("256b25f4-4cfb-4684-77a8-73872ef455a1", False),
+        ("256b25f4-4cfb-4684-b7a8-73872ef455a", False),
+        ("myanalysis", False),
+        ("myanalysis.12", False),
+        ("", False),
+    ],
+)
+def test_is_uuid_v4(uuid_or_name, expected):
+    """Test detection of UUIDv4 strings."""
+    assert is_uuid_v4(uuid_or_name) is expected
+
+
+def test_get_most_recent_jobs_info(
+    session, sample_serial_workflow_in_db, sample_yadage_workflow_in_db
+):
+    """Test getting the most recent job of several workflows at once."""
+    created = datetime(2024, 1, 1, 12, 0, 0)
+    for minutes, job_name in [(1, "first"), (2, "second")]:
+        session.add(
+            Job(
+                workflow_uuid=sample_serial_workflow_in_db.id_,
+                job_name=job_name,
+                prettified_cmd=f"echo {job_name}",
+                created=created + timedelta(minutes=minutes),
+            )
+        )
+    session.commit()
+
+    assert get_most_recent_jobs_info(
+        [sample_serial_workflow_in_db.id_, sample_yadage_workflow_in_db.id_]
+    ) == {
+        sample_serial_workflow_in_db.id_: {
+            "prettified_cmd": "echo second",
+            "current_job_name": "second",
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "depth, expected",
+    [
+        (0, "<truncated>"),
+        (
+            1,
+            {
+                "workflow_logs": "workflow logs",
+                "job_logs": "<truncated>",
+                "engine_specific": None,
+            },
+        ),
+        (
+            2,
+            {
+                "workflow_logs": "workflow logs",
+                "job_logs": {"job-1": "<truncated>"},
+                "engine_specific": None,
+            },
+        ),
+        (
+            3,
+            {
+                "workflow_logs": "workflow logs",
+                "job_logs": {"job-1": {"logs": "job logs", "cmd": "<truncated>"}},
+                "engine_specific": None,
+            },
+        ),
+    ],
+)
+def test_truncate_workflow_logs(depth, expected):
+    """Test truncation of workflow logs nested deeper than a given depth."""
+    workflow_logs = {
+        "workflow_logs": "workflow logs",
+        "job_logs": {"job-1": {"logs": "job logs", "cmd": ["echo", "hello"]}},
+        "engine_specific": None,
+    }
+    assert truncate_workflow_logs(workflow_logs, depth) == expected
+    assert truncate_workflow_logs(workflow_logs, 4) == workflow_logs
+
+
+def test_get_workflow_progress_does_not_modify_job_progress(
+    session, sample_serial_workflow_in_db
+):
+    """Test that the job progress of the workflow is copied, not modified."""
+    job_progress = {"running": {"total": 2, "job_ids": ["job-1", None]}}
+    sample_serial_workflow_in_db.job_progress = job_progress
+    session.commit()
+
+    progress = get_workflow_progress(sample_serial_workflow_in_db, True, {})
+    assert progress["running"] == {"total": 2, "job_ids": ["job-1"]}
+    assert sample_serial_workflow_in_db.job_progress == {
+        "running": {"total": 2, "job_ids": ["job-1", None]}
+    }
+    progress["finished"]["job_ids"].append("job-2")
+    assert progress["failed"] == {"total": 0, "job_ids": []}
@@ -7,6 +7,8 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 """REANA-Workflow-Controller module tests."""
 
+import datetime
+import gzip
 import io
 import json
 import os
@@ -25,9 +27,12 @@ from reana_db.models import (
     Workflow,
     UserWorkflow,
 )
+from reana_db.utils import build_workspace_path, store_workflow_disk_quota
 from reana_workflow_controller.rest.utils import (
     create_workflow_workspace,
     delete_workflow,
+    encode_workflow_cursor,
+    get_workflow_name,
 )
 from reana_workflow_controller.rest.workflows_status import START, STOP
 from reana_workflow_controller.workflow_run_manager import WorkflowRunManager
@@ -60,6 +65,7 @@ def test_get_workflows(app, session, user0, cwl_workflow_with_name):
             query_string={"user": user0.id_, "type": "batch"},
         )
         assert res.status_code == 200
+        assert json.loads(res.get_data(as_text=True))["user_has_workflows"]
         response_data = json.loads(res.get_data(as_text=True))["items"]
         expected_data = [
             {
@@ -79,6 +85,75 @@ def test_get_workflows(app, session, user0, cwl_workflow_with_name):
         assert response_data == expected_data
 
 
+def test_get_workflows_user_email_updated(app, session, user0, add_workflow_to_db):
+    """Test that listing workflows picks up changes to the user email."""
+    add_workflow_to_db(user0)
+    original_email = user0.email
+    client = app.test_client()
+    try:
+        for email in (original_email, "updated@example.org"):
+            user0.email = email
+            session.commit()
+            # each request has its own application context, as in production
+            with app.app_context():
+                res = client.get(
+                    url_for("workflows.get_workflows"),
+                    query_string={"user": user0.id_, "type": "batch"},
+                )
+            assert res.status_code == 200
+            assert res.json["items"][0]["owner_email"] == email
+    finally:
+        user0.email = original_email
+        session.commit()
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["status", "share", "disk"],
+)
+def test_get_workflows_not_modified(
+    app, session, user0, user1, sample_serial_workflow_in_db, change
+):
+    """Test revalidating the list of workflows with its ETag."""
+    workflow = sample_serial_workflow_in_db
+    with app.test_client() as client:
+        query_string = {"user": user0.id_, "type": "batch"}
+        res = client.get(url_for("workflows.get_workflows"), query_string=query_string)
+        assert res.status_code == 200
+        etag = res.headers["ETag"]
+
+        with mock.patch(
+            "reana_workflow_controller.rest.workflows._get_owner_emails"
+        ) as get_owner_emails:
+            res = client.get(
+                url_for("workflows.get_workflows"),
+                query_string=query_string,
+                headers={"If-None-Match": etag},
+            )
+        assert res.status_code == 304
+        assert res.headers["ETag"] == etag
+        assert not res.get_data()
+        # unchanged listings are not built again
+        get_owner_emails.assert_not_called()
+
+        if change == "status":
+            workflow.status = RunStatus.running
+        elif change == "share":
+            session.add(UserWorkflow(workflow_id=workflow.id_, user_id=user1.id_))
+        else:
+            store_workflow_disk_quota(
+                workflow, bytes_to_sum=1024, override_policy_checks=True
+            )
+        session.commit()
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string=query_string,
+            headers={"If-None-Match": etag},
+        )
+        assert res.status_code == 200
+        assert res.headers["ETag"] != etag
+
+
 def test_get_workflows_wrong_user(app):
     """Test list of workflows for unknown user."""
     with app.test_client() as client:
@@ -128,6 +203,278 @@ def test_get_workflows_include_progress(app, user0, sample_yadage_workflow_in_db
         assert "finished" not in response_data["progress"]
 
 
+def test_get_workflows_cursor_pagination(app, user0, add_workflow_to_db):
+    """Test listing workflows using cursor-based pagination."""
+    created = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    workflows = {}
+    for i in range(5):
+        # some workflows share the creation date to check that ties are broken
+        workflow = add_workflow_to_db(
+            user0, created=created + datetime.timedelta(minutes=i // 2)
+        )
+        workflows[str(workflow.id_)] = workflow
+    workflow_ids = set(workflows)
+
+    with app.test_client() as client:
+        pages = []
+        cursor = first_cursor = None
+        while True:
+            query_string = {"user": user0.id_, "type": "batch", "size": 2}
+            if cursor:
+                query_string["after"] = cursor
+            res = client.get(
+                url_for("workflows.get_workflows"), query_string=query_string
+            )
+            assert res.status_code == 200
+            response_data = json.loads(res.get_data(as_text=True))
+            assert response_data["total"] == 5
+            pages.append([workflow["id"] for workflow in response_data["items"]])
+            cursor = response_data["next_cursor"]
+            first_cursor = first_cursor or cursor
+            if not cursor:
+                assert not response_data["has_next"]
+                break
+        assert [len(page) for page in pages] == [2, 2, 1]
+        listed_ids = [workflow_id for page in pages for workflow_id in page]
+        assert len(listed_ids) == 5
+        assert set(listed_ids) == workflow_ids
+
+        # go back to the first page
+        previous_pages = []
+        cursor = response_data["prev_cursor"]
+        while cursor:
+            res = client.get(
+                url_for("workflows.get_workflows"),
+                query_string={
+                    "user": user0.id_,
+                    "type": "batch",
+                    "size": 2,
+                    "before": cursor,
+                },
+            )
+            assert res.status_code == 200
+            response_data = json.loads(res.get_data(as_text=True))
+            assert response_data["has_next"]
+            previous_pages.insert(
+                0, [workflow["id"] for workflow in response_data["items"]]
+            )
+            cursor = response_data["prev_cursor"]
+        assert previous_pages == pages[:-1]
+
+        # nothing is listed before the first workflow
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "size": 2,
+                "before": encode_workflow_cursor(workflows[listed_ids[0]]),
+            },
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))
+        assert response_data["items"] == []
+        assert not response_data["has_next"] and not response_data["next_cursor"]
+        assert not response_data["has_prev"] and not response_data["prev_cursor"]
+
+        # nothing is listed after the last workflow
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "size": 2,
+                "after": encode_workflow_cursor(workflows[listed_ids[-1]]),
+            },
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))
+        assert response_data["items"] == []
+        assert not response_data["has_next"] and not response_data["next_cursor"]
+        assert not response_data["has_prev"] and not response_data["prev_cursor"]
+
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={"user": user0.id_, "type": "batch", "after": "wrong"},
+        )
+        assert res.status_code == 400
+
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "sort": "disk-desc",
+                "after": first_cursor,
+            },
+        )
+        assert res.status_code == 400
+
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "after": first_cursor,
+                "before": first_cursor,
+            },
+        )
+        assert res.status_code == 400
+
+
+def test_get_workflows_in_chunks(app, user0, add_workflow_to_db):
+    """Test listing more workflows than loaded from the database at once."""
+    workflow_ids = [str(add_workflow_to_db(user0).id_) for _ in range(5)]
+
+    with app.test_client() as client:
+        with mock.patch(
+            "reana_workflow_controller.rest.workflows.WORKFLOWS_LISTING_CHUNK_SIZE", 2
+        ):
+            res = client.get(
+                url_for("workflows.get_workflows"),
+                query_string={"user": user0.id_, "type": "batch", "sort": "asc"},
+            )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))["items"]
+        assert [workflow["id"] for workflow in response_data] == workflow_ids
+
+
+def test_get_workflows_include_workspace_size(
+    app, user0, sample_serial_workflow_in_db, sample_yadage_workflow_in_db
+):
+    """Test listing workflows with the disk usage of their workspaces."""
+    store_workflow_disk_quota(sample_serial_workflow_in_db, override_policy_checks=True)
+    store_workflow_disk_quota(
+        sample_serial_workflow_in_db, bytes_to_sum=2048, override_policy_checks=True
+    )
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "include_workspace_size": True,
+            },
+        )
+        assert res.status_code == 200
+        sizes = {
+            workflow["id"]: workflow["size"]
+            for workflow in json.loads(res.get_data(as_text=True))["items"]
+        }
+        expected_size = sample_serial_workflow_in_db.get_quota_usage()["disk"]["usage"]
+        assert expected_size["raw"] >= 2048
+        assert sizes[str(sample_serial_workflow_in_db.id_)] == expected_size
+        assert sizes[str(sample_yadage_workflow_in_db.id_)] == {
+            "raw": -1,
+            "human_readable": "",
+        }
+
+
+def test_get_workflows_sort_by_disk(
+    app, user0, sample_serial_workflow_in_db, sample_yadage_workflow_in_db
+):
+    """Test listing workflows sorted by the disk usage of their workspaces."""
+    for workflow, disk_usage in [
+        (sample_serial_workflow_in_db, 1024**2),
+        (sample_yadage_workflow_in_db, 4 * 1024**2),
+    ]:
+        store_workflow_disk_quota(workflow, override_policy_checks=True)
+        store_workflow_disk_quota(
+            workflow, bytes_to_sum=disk_usage, override_policy_checks=True
+        )
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={"user": user0.id_, "type": "batch", "sort": "disk-desc"},
+        )
+        assert res.status_code == 200
+        listed_ids = [
+            workflow["id"]
+            for workflow in json.loads(res.get_data(as_text=True))["items"]
+        ]
+        assert listed_ids == [
+            str(sample_yadage_workflow_in_db.id_),
+            str(sample_serial_workflow_in_db.id_),
+        ]
+
+
+def test_get_workflows_interactive(
+    app, session, user0, sample_serial_workflow_in_db, sample_yadage_workflow_in_db
+):
+    """Test listing workflows with an open interactive session."""
+    path = "/5d9b30fd-f225-4615-9107-b1373afec070"
+    int_session = InteractiveSession(
+        name="interactive-jupyter-5d9b30fd-f225-4615-9107-b1373afec070-5lswkp",
+        path=path,
+        owner_id=sample_serial_workflow_in_db.owner_id,
+    )
+    sample_serial_workflow_in_db.sessions.append(int_session)
+    session.add(sample_serial_workflow_in_db)
+    session.commit()
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={"user": user0.id_, "type": "interactive"},
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))["items"]
+        # workflows without interactive sessions are not listed
+        assert len(response_data) == 1
+        assert response_data[0]["id"] == str(sample_serial_workflow_in_db.id_)
+        assert response_data[0]["session_type"] == int_session.type_.name
+        assert response_data[0]["session_uri"] == path
+        assert response_data[0]["session_status"] == int_session.status.name
+
+
+@pytest.mark.parametrize(
+    "search_name,expected_count",
+    [
+        ("test_workflow", 1),
+        ("TEST", 1),
+        ("my%workflow", 0),
+        ("my_test_w_rkflow", 0),
+    ],
+)
+def test_get_workflows_search(
+    app, user0, add_workflow_to_db, search_name, expected_count
+):
+    """Test listing workflows filtered by name."""
+    add_workflow_to_db(user0)
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user0.id_,
+                "type": "batch",
+                "search": json.dumps({"name": [search_name]}),
+            },
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))["items"]
+        assert len(response_data) == expected_count
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        json.dumps({"name": ["a" * 5000]}),
+        "{not json",
+        json.dumps(["name"]),
+        json.dumps({"name": []}),
+        json.dumps({"name": "foo"}),
+    ],
+)
+def test_get_workflows_search_malformed(app, user0, search):
+    """Test listing workflows with a malformed or too long search filter."""
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={"user": user0.id_, "type": "batch", "search": search},
+        )
+        assert res.status_code == 400
+        assert "search" in json.loads(res.get_data(as_text=True))["message"]
+
+
 def test_get_workflows_include_retention_rules(
     app, user0, sample_yadage_workflow_in_db
 ):
@@ -248,6 +595,40 @@ def test_get_workflows_shared_with(
         assert response_data[0]["shared_with"] == [user2.email]
 
 
+@pytest.mark.parametrize("shared_with", ["nobody", "anybody"])
+def test_get_workflows_shared_with_nobody_or_anybody(
+    app,
+    session,
+    user1,
+    user2,
+    add_workflow_to_db,
+    sample_yadage_workflow_in_db_owned_by_user1,
+    shared_with,
+):
+    """Test listing workflows that are shared or not shared with anybody."""
+    shared_workflow = sample_yadage_workflow_in_db_owned_by_user1
+    unshared_workflow = add_workflow_to_db(user1, name="unshared_workflow")
+    session.add(UserWorkflow(workflow_id=shared_workflow.id_, user_id=user2.id_))
+    session.commit()
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflows"),
+            query_string={
+                "user": user1.id_,
+                "shared_with": shared_with,
+                "type": "batch",
+            },
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))["items"]
+        expected_workflow = (
+            unshared_workflow if shared_with == "nobody" else shared_workflow
+        )
+        assert [workflow["id"] for workflow in response_data] == [
+            str(expected_workflow.id_)
+        ]
+
+
 def test_get_workflows_shared_by_and_shared_with(
     app, user1, user2, sample_yadage_workflow_in_db_owned_by_user1
 ):
@@ -318,6 +699,27 @@ def test_create_workflow_with_name(
         assert os.path.exists(workflow.workspace_path)
 
 
+def test_create_workflow_with_non_ascii_name(
+    app, session, user0, cwl_workflow_with_name, tmp_shared_volume_path
+):
+    """Test create workflow with a name containing non-ASCII characters."""
+    with app.test_client() as client:
+        res = client.post(
+            url_for("workflows.create_workflow"),
+            query_string={
+                "user": user0.id_,
+                "workspace_root_path": tmp_shared_volume_path,
+            },
+            content_type="application/json",
+            data=json.dumps(dict(cwl_workflow_with_name, workflow_name="wörkflow")),
+        )
+        assert res.status_code == 400
+        assert json.loads(res.get_data(as_text=True)) == {
+            "message": "Workflow name wörkflow is not valid."
+        }
+        assert not Workflow.query.filter(Workflow.name == "wörkflow").first()
+
+
 def test_create_workflow_without_name(
     app, session, user0, cwl_workflow_without_name, tmp_shared_volume_path
 ):
@@ -362,6 +764,36 @@ def test_create_workflow_without_name(
         assert os.path.exists(workflow.workspace_path)
 
 
+def test_create_workflow_removes_workspace_on_db_error(
+    app, session, user0, cwl_workflow_with_name, tmp_shared_volume_path
+):
+    """Test that the workspace is cleaned up when the workflow cannot be stored."""
+    workflow_uuid = uuid.uuid4()
+    # retention rule too long to be stored in the database
+    retention_rules = [{"workspace_files": "a" * 300, "retention_days": 1}]
+    workflow_spec = dict(cwl_workflow_with_name, retention_rules=retention_rules)
+    with app.test_client() as client:
+        with mock.patch(
+            "reana_workflow_controller.rest.workflows.uuid4",
+            return_value=workflow_uuid,
+        ):
+            res = client.post(
+                url_for("workflows.create_workflow"),
+                query_string={
+                    "user": user0.id_,
+                    "workspace_root_path": tmp_shared_volume_path,
+                },
+                content_type="application/json",
+                data=json.dumps(workflow_spec),
+            )
+        assert res.status_code == 500
+        assert not Workflow.query.filter(Workflow.id_ == workflow_uuid).first()
+        workspace_path = build_workspace_path(
+            user0.id_, workflow_uuid, tmp_shared_volume_path
+        )
+        assert not os.path.exists(workspace_path)
+
+
 def test_create_workflow_wrong_user(
     app, session, tmp_shared_volume_path, cwl_workflow_with_name
 ):
@@ -738,6 +1170,63 @@ def test_get_workflow_status_with_uuid(
         assert json_response.get("status") == workflow.status.name
 
 
+@pytest.mark.parametrize(
+    "include_logs, expected_logs",
+    [
+        (None, ["test job logs"]),
+        ("true", ["test job logs"]),
+        ("false", []),
+    ],
+)
+def test_get_workflow_status_include_logs(
+    app, session, user0, sample_serial_workflow_in_db, include_logs, expected_logs
+):
+    """Test getting the workflow status with and without the job logs."""
+    session.add(
+        Job(workflow_uuid=sample_serial_workflow_in_db.id_, logs="test job logs")
+    )
+    session.commit()
+    query_string = {"user": user0.id_}
+    if include_logs:
+        query_string["include_logs"] = include_logs
+    with app.test_client() as client:
+        res = client.get(
+            url_for(
+                "statuses.get_workflow_status",
+                workflow_id_or_name=sample_serial_workflow_in_db.id_,
+            ),
+            query_string=query_string,
+        )
+        assert res.status_code == 200
+        json_response = json.loads(res.data.decode())
+        assert json_response["status"] == sample_serial_workflow_in_db.status.name
+        logs = json.loads(json_response["logs"])
+        assert [job["logs"] for job in logs.values()] == expected_logs
+
+
+@pytest.mark.parametrize(
+    "endpoint, method",
+    [
+        ("statuses.get_workflow_logs", "get"),
+        ("statuses.get_workflow_status", "get"),
+        ("statuses.set_workflow_status", "put"),
+    ],
+)
+def test_workflow_status_endpoints_without_user(
+    app, sample_serial_workflow_in_db, endpoint, method
+):
+    """Test that the status endpoints require the user argument."""
+    with app.test_client() as client:
+        res = getattr(client, method)(
+            url_for(endpoint, workflow_id_or_name=sample_serial_workflow_in_db.id_),
+            query_string={"status": START},
+        )
+        assert res.status_code == 400
+        assert json.loads(res.data.decode()) == {
+            "message": "User UUID is not supplied."
+        }
+
+
 def test_get_workflow_status_with_name(app, session, user0, cwl_workflow_with_name):
     """Test get workflow status."""
     with app.test_client() as client:
@@ -1210,33 +1699,32 @@ def test_get_created_workflow_logs(
                 "workflow_name": workflow_name,
                 "user": str(user0.id_),
                 "live_logs_enabled": False,
-                "logs": json.dumps(
-                    {
-                        "workflow_logs": (
-                            opensearch_return_value if opensearch_return_value else ""
-                        ),
-                        "job_logs": {
-                            str(workflow_job.id_): {
-                                "workflow_uuid": str(workflow_job.workflow_uuid),
-                                "job_name": "",
-                                "compute_backend": "",
-                                "backend_job_id": "",
-                                "docker_img": "",
-                                "cmd": "",
-                                "status": workflow_job.status.name,
-                                "logs": (
-                                    opensearch_return_value
-                                    if opensearch_return_value
-                                    else workflow_job.logs
-                                ),
-                                "started_at": None,
-                                "finished_at": None,
-                            }
-                        },
-                        "engine_specific": None,
-                    }
-                ),
+                "logs": {
+                    "workflow_logs": (
+                        opensearch_return_value if opensearch_return_value else ""
+                    ),
+                    "job_logs": {
+                        str(workflow_job.id_): {
+                            "workflow_uuid": str(workflow_job.workflow_uuid),
+                            "job_name": "",
+                            "compute_backend": "",
+                            "backend_job_id": "",
+                            "docker_img": "",
+                            "cmd": "",
+                            "status": workflow_job.status.name,
+                            "logs": (
+                                opensearch_return_value
+                                if opensearch_return_value
+                                else workflow_job.logs
+                            ),
+                            "started_at": None,
+                            "finished_at": None,
+                        }
+                    },
+                    "engine_specific": None,
+                },
             }
+            response_data["logs"] = json.loads(response_data["logs"])
             assert response_data == expected_data
             mock_method.call_count == 2
 
@@ -1279,9 +1767,9 @@ def test_get_created_workflow_opensearch_disabled(
                 "workflow_name": workflow_name,
                 "user": str(user0.id_),
                 "live_logs_enabled": False,
-                "logs": '{"workflow_logs": "", "job_logs": {},'
-                ' "engine_specific": null}',
+                "logs": {"workflow_logs": "", "job_logs": {}, "engine_specific": None},
             }
+            response_data["logs"] = json.loads(response_data["logs"])
             assert response_data == expected_data
             mock_method.assert_not_called()
 
@@ -1338,6 +1826,65 @@ def test_get_workflow_logs_unauthorized(
         assert res.status_code == 404
 
 
+@pytest.mark.parametrize(
+    "job_logs, accept_encoding, compressed",
+    [
+        ("test logs\n" * 1000, "gzip", True),
+        ("test logs\n" * 1000, None, False),
+        ("test logs\n", "gzip", False),
+    ],
+)
+def test_get_workflow_logs_gzip(
+    app,
+    session,
+    user0,
+    sample_serial_workflow_in_db,
+    job_logs,
+    accept_encoding,
+    compressed,
+):
+    """Test compression of large workflow logs responses."""
+    session.add(Job(workflow_uuid=sample_serial_workflow_in_db.id_, logs=job_logs))
+    session.commit()
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    with app.test_client() as client:
+        res = client.get(
+            url_for(
+                "statuses.get_workflow_logs",
+                workflow_id_or_name=sample_serial_workflow_in_db.id_,
+            ),
+            query_string={"user": user0.id_},
+            headers=headers,
+        )
+        assert res.status_code == 200
+        assert "Accept-Encoding" in res.vary
+        body = res.get_data()
+        if compressed:
+            assert res.content_encoding == "gzip"
+            body = gzip.decompress(body)
+        else:
+            assert res.content_encoding is None
+        logs = json.loads(json.loads(body)["logs"])
+        assert [job["logs"] for job in logs["job_logs"].values()] == [job_logs]
+
+
+@pytest.mark.parametrize("depth", ["abc", "-1", "1.5", ""])
+def test_get_workflow_logs_invalid_depth(
+    app, session, user0, sample_serial_workflow_in_db, depth
+):
+    """Test getting workflow logs with a depth that is not a non-negative integer."""
+    with app.test_client() as client:
+        res = client.get(
+            url_for(
+                "statuses.get_workflow_logs",
+                workflow_id_or_name=sample_serial_workflow_in_db.id_,
+            ),
+            query_string={"user": user0.id_, "depth": depth},
+        )
+        assert res.status_code == 400
+        assert res.json == {"message": "Depth must be a non-negative integer."}
+
+
 def test_start_input_parameters(
     app,
     session,
@@ -1480,6 +2027,41 @@ def test_delete_workflow(app, session, user0, sample_yadage_workflow_in_db, stat
         assert sample_yadage_workflow_in_db.status == RunStatus.deleted
 
 
+def test_delete_workflow_without_parameters(
+    app, session, user0, sample_yadage_workflow_in_db
+):
+    """Test deletion of a workflow without a JSON body, using the defaults."""
+    sample_yadage_workflow_in_db.status = RunStatus.finished
+    session.commit()
+    with app.test_client() as client:
+        res = client.put(
+            url_for(
+                "statuses.set_workflow_status",
+                workflow_id_or_name=sample_yadage_workflow_in_db.id_,
+            ),
+            query_string={"user": user0.id_, "status": "deleted"},
+        )
+        assert res.status_code == 200
+        assert sample_yadage_workflow_in_db.status == RunStatus.deleted
+
+
+def test_set_workflow_status_unknown_status(app, user0, sample_yadage_workflow_in_db):
+    """Test that unknown statuses are rejected with the accepted ones."""
+    with app.test_client() as client:
+        res = client.put(
+            url_for(
+                "statuses.set_workflow_status",
+                workflow_id_or_name=sample_yadage_workflow_in_db.id_,
+            ),
+            query_string={"user": user0.id_, "status": "paused"},
+        )
+        assert res.status_code == 400
+        message = json.loads(res.get_data(as_text=True))["message"]
+        assert message.startswith("Status paused is not one of: ")
+        accepted_statuses = message.split(": ")[1].split(", ")
+        assert sorted(accepted_statuses) == sorted([START, STOP, "deleted"])
+
+
 def test_delete_all_workflow_runs(app, session, user0, yadage_workflow_with_name):
     """Test deletion of all runs of a given workflow."""
     # add 5 workflows in the database with the same name
@@ -1702,6 +2284,49 @@ def test_get_workspace_diff(
         assert "# File" in response_data["workspace_listing"]
 
 
+@pytest.mark.parametrize("missing_side", ["a", "b"])
+def test_get_workflow_diff_non_existent_workflow(
+    app, user0, sample_serial_workflow_in_db, missing_side
+):
+    """Test diffing a workflow with a workflow that does not exist."""
+    missing_workflow = str(uuid.uuid4())
+    workflows = {
+        "workflow_id_or_name_a": sample_serial_workflow_in_db.id_,
+        "workflow_id_or_name_b": sample_serial_workflow_in_db.id_,
+        f"workflow_id_or_name_{missing_side}": missing_workflow,
+    }
+    with app.test_client() as client:
+        res = client.get(
+            url_for("workflows.get_workflow_diff", **workflows),
+            query_string={"user": user0.id_},
+        )
+        assert res.status_code == 404
+        assert json.loads(res.get_data(as_text=True)) == {
+            "message": f"Workflow {missing_workflow} does not exist."
+        }
+
+
+def test_get_workflow_diff_with_itself(
+    app, user0, sample_serial_workflow_in_db, tmp_shared_volume_path
+):
+    """Test diffing a workflow with itself."""
+    with app.test_client() as client:
+        res = client.get(
+            url_for(
+                "workflows.get_workflow_diff",
+                workflow_id_or_name_a=sample_serial_workflow_in_db.id_,
+                workflow_id_or_name_b=get_workflow_name(sample_serial_workflow_in_db),
+            ),
+            query_string={"user": user0.id_},
+        )
+        assert res.status_code == 200
+        response_data = json.loads(res.get_data(as_text=True))
+        assert json.loads(response_data["reana_specification"]) == {
+            section: [] for section in sample_serial_workflow_in_db.reana_specification
+        }
+        assert json.loads(response_data["workspace_listing"]) == ""
+
+
 def test_create_interactive_session(
     app, user0, sample_serial_workflow_in_db, interactive_session_environments
 ):
@@ -2090,6 +2715,39 @@ def test_share_non_existent_workflow(app, user1, user2):
         )
 
 
+@pytest.mark.parametrize("endpoint", ["share_workflow", "unshare_workflow"])
+def test_share_workflow_non_existent_sharer(
+    app, user2, sample_yadage_workflow_in_db_owned_by_user1, endpoint
+):
+    """Test (un)sharing a workflow on behalf of a non-existent user."""
+    workflow = sample_yadage_workflow_in_db_owned_by_user1
+    non_existent_user_id = str(uuid.uuid4())
+    with app.test_client() as client:
+        if endpoint == "share_workflow":
+            res = client.post(
+                url_for(
+                    "workflows.share_workflow", workflow_id_or_name=str(workflow.id_)
+                ),
+                query_string={"user": non_existent_user_id},
+                content_type="application/json",
+                data=json.dumps({"user_email_to_share_with": user2.email}),
+            )
+        else:
+            res = client.post(
+                url_for(
+                    "workflows.unshare_workflow", workflow_id_or_name=str(workflow.id_)
+                ),
+                query_string={
+                    "user": non_existent_user_id,
+                    "user_email_to_unshare_with": user2.email,
+                },
+            )
+        assert res.status_code == 404
+        assert res.get_json()["message"] == (
+            f"User with id '{non_existent_user_id}' does not exist."
+        )
+
+
 def test_share_workflow_with_self(
     app, user1, sample_serial_workflow_in_db_owned_by_user1
 ):